@@ -30,6 +30,7 @@ from rf4s.component.friction_brake import FrictionBrake
 from rf4s.config import load_cfg
 from rf4s.controller.detection import Detection
 from rf4s.controller.player import Player
+from rf4s.controller.screenshot import SUFFIXES
 from rf4s.controller.timer import Timer
 from rf4s.controller.window import Window
 from rf4s.result import BotResult, CraftResult, HarvestResult, Result
@@ -124,6 +125,9 @@ class BotApp(App):
         self.validate_game_window()
         self.validate_favorite_icon()
         self.validate_screenshot_notification()
+        self.validate_screenshot_settings()
+        self.validate_notification_settings()
+        self.validate_background_settings()
         self.validate_spool_detection()
 
     def display_info(self):
@@ -379,6 +383,69 @@ class BotApp(App):
                 "Miaotixing doesn't support image message, no screenshot will be sent"
             )
 
+    def validate_screenshot_settings(self):
+        settings = self.cfg.BOT.SCREENSHOT
+        valid = True
+        if settings.FORMAT not in SUFFIXES:
+            logger.critical(
+                "Invalid BOT.SCREENSHOT.FORMAT: '%s' (options: %s)",
+                settings.FORMAT,
+                ", ".join(SUFFIXES),
+            )
+            valid = False
+        if not 0 <= settings.PNG_COMPRESSION <= 9:
+            logger.critical("BOT.SCREENSHOT.PNG_COMPRESSION must be between 0 and 9")
+            valid = False
+        if not 1 <= settings.QUALITY <= 100:
+            logger.critical("BOT.SCREENSHOT.QUALITY must be between 1 and 100")
+            valid = False
+        if settings.MAX_DIMENSION < 0:
+            logger.critical("BOT.SCREENSHOT.MAX_DIMENSION must not be negative")
+            valid = False
+        if not valid:
+            utils.safe_exit()
+
+    def validate_notification_settings(self):
+        settings = self.cfg.BOT.NOTIFICATION
+        valid = True
+        if settings.WORKERS < 1:
+            logger.critical("BOT.NOTIFICATION.WORKERS must be at least 1")
+            valid = False
+        for key in ("CONNECT_TIMEOUT", "READ_TIMEOUT", "DIGEST_WINDOW"):
+            if settings[key] <= 0:
+                logger.critical("BOT.NOTIFICATION.%s must be positive", key)
+                valid = False
+        for key in ("MAX_RETRIES", "FLUSH_TIMEOUT", "DIGEST_SIZE"):
+            if settings[key] < 0:
+                logger.critical("BOT.NOTIFICATION.%s must not be negative", key)
+                valid = False
+        if not valid:
+            utils.safe_exit()
+
+    def validate_background_settings(self):
+        bot = self.cfg.BOT
+        valid = True
+        for key, value in (
+            ("PERCEPTION_RATE", bot.PERCEPTION_RATE),
+            ("FLIGHT_RECORDER.RATE", bot.FLIGHT_RECORDER.RATE),
+            ("FLIGHT_RECORDER.MAX_DIMENSION", bot.FLIGHT_RECORDER.MAX_DIMENSION),
+            ("SESSION_RECORDER.RATE", bot.SESSION_RECORDER.RATE),
+            ("SESSION_RECORDER.MAX_DIMENSION", bot.SESSION_RECORDER.MAX_DIMENSION),
+        ):
+            if value < 0:
+                logger.critical("BOT.%s must not be negative", key)
+                valid = False
+        if bot.FLIGHT_RECORDER.MEMORY <= 0:
+            logger.critical("BOT.FLIGHT_RECORDER.MEMORY must be positive")
+            valid = False
+        if not 1 <= bot.SESSION_RECORDER.COMPRESSION_LEVEL <= 22:
+            logger.critical(
+                "BOT.SESSION_RECORDER.COMPRESSION_LEVEL must be between 1 and 22"
+            )
+            valid = False
+        if not valid:
+            utils.safe_exit()
+
     def validate_spool_detection(self):
         if self.cfg.ARGS.RAINBOW is None:
             logger.warning(
@@ -115,10 +115,8 @@ def monitor_friction_brake(friction_brake: FrictionBrake) -> None:
                 fish_hooked = True
 
             with friction_brake.lock:
-                if (
-                    friction_brake.detection.is_friction_brake_high()
-                    or friction_brake.detection.is_reel_burning()
-                ):
+                hud_status = friction_brake.detection.get_hud_status()
+                if hud_status.friction_brake_high or hud_status.reel_burning:
                     friction_brake.change(increase=False)
                     sleep(
                         add_jitter(
@@ -1,20 +1,21 @@
 """Basic tackle actions like pulling, pirking, etc."""
 
 import random
+from dataclasses import dataclass
 from enum import Enum, auto
 from time import sleep
-from typing import Literal
+from typing import Callable, Literal
 
 import pyautogui as pag
 import win32api
 import win32con
-from PIL import ImageFilter
 from pyscreeze import Box
 
 from rf4s import exceptions, utils
 from rf4s.component.logger import logger
 from rf4s.controller.timer import Timer
-from rf4s.controller.detection import Detection
+from rf4s.controller.detection import LURE_MODES, Detection
+from rf4s.controller.scheduler import PollingScheduler
 from rf4s.utils import add_jitter, press
 
 CAST_SCALE = 0.4  # 25% / 0.4s
@@ -24,6 +25,7 @@ SINK_DELAY = 2
 LIFT_DURATION = 3
 NUM_OF_MOVEMENT = 4
 LANDING_NET_DURATION = 6
+PERCEPTION_TIMEOUT = 1
 
 OFFSET = 100
 
@@ -38,6 +40,20 @@ class StageId(Enum):
     LIFT = auto()
 
 
+@dataclass
+class Check:
+    """A detection check in a polling loop.
+
+    Attributes:
+        flag (str): Flag of GameState, the check fires if it's True.
+        error (type[Exception] | None): Error to raise when the check fires, None to
+            finish the loop normally.
+    """
+
+    flag: str
+    error: type[Exception] | None
+
+
 class Tackle:
     """Class for all tackle-dependent methods.
 
@@ -61,17 +77,108 @@ class Tackle:
         self.available = True
         self.gear_ratio_changed = False
         self.stage = None
+        self.perception = None
+        self.scheduler = PollingScheduler(timer)
+        self._build_check_plans()
+
+    def _build_check_plans(self) -> None:
+        """Compile the checks of polling loops according to the profile and flags.
+
+        The configuration is frozen at this point, so only the checks that can fire
+        are kept. The order decides which check wins if several fire at once, so
+        it's the same as the original checks of the loops.
+        """
+        mode = self.cfg.PROFILE.MODE
+        line_checks = []
+        if self.cfg.BOT.SPOOLING_DETECTION:
+            line_checks.append(Check("line_at_end", exceptions.LineAtEndError))
+        if self.cfg.BOT.SNAG_DETECTION:
+            line_checks.append(Check("line_snagged", exceptions.LineSnaggedError))
+        captured = Check("fish_captured", exceptions.FishCapturedError)
+
+        self.reset_plan = [
+            Check("tackle_ready", None),
+            Check("fish_hooked", exceptions.FishHookedError),
+            captured,
+        ]
+        if mode not in LURE_MODES:  # It's always chosen in these modes
+            self.reset_plan.append(Check("bait_missing", exceptions.BaitNotChosenError))
+        self.reset_plan.extend(line_checks)
+        if mode in LURE_MODES:
+            self.reset_plan.append(Check("lure_broken", exceptions.LureBrokenError))
+        self.reset_plan.append(Check("tackle_broken", exceptions.TackleBrokenError))
+        if mode == "bottom":  # Dry mix is only used with feeders
+            self.reset_plan.append(
+                Check("dry_mix_missing", exceptions.DryMixNotChosenError)
+            )
+
+        self.retrieve_plan = [
+            Check("fish_hooked", None),
+            Check("retrieval_finished", None),
+            captured,
+            *line_checks,
+        ]
+        self.pull_plan = [captured, *line_checks]
+        self.lift_plan = [Check("fish_captured", None)]
+        if self.cfg.BOT.SNAG_DETECTION:
+            self.lift_plan.append(Check("line_snagged", exceptions.LineSnaggedError))
+
+    def run_checks(self, plan: list[Check]) -> bool:
+        """Run the checks of a plan in order against one frame.
+
+        The latest state from the perception thread is used if it's running.
+        Otherwise, the flags are perceived one by one in plan order, so the
+        full-window template matching at the end of a plan is skipped once an
+        earlier check fires.
+
+        :param plan: Checks to run.
+        :type plan: list[Check]
+        :raises Exception: The error of the first check that fires.
+        :return: True if a check without error fires, False otherwise.
+        :rtype: bool
+        """
+        state = None
+        if self.perception is not None:
+            flags = [check.flag for check in plan]
+            state = self.perception.get_state(flags, PERCEPTION_TIMEOUT)
+        if state is not None:
+            return self._run_checks(plan, lambda flag: getattr(state, flag))
+        with self.detection.frame():  # Perception thread is disabled or too slow
+            return self._run_checks(plan, self.detection.get_flag)
+
+    @staticmethod
+    def _run_checks(plan: list[Check], get_flag: Callable[[str], bool]) -> bool:
+        for check in plan:
+            if get_flag(check.flag):
+                if check.error is None:
+                    return True
+                raise check.error
+        return False
+
+    def wait_for_change(self, delay: float) -> None:
+        """Wait until the next check, or until the game state changes.
+
+        Without the perception thread, it simply sleeps for the delay.
+
+        :param delay: Base delay before the next check.
+        :type delay: float
+        """
+        if self.perception is None:
+            sleep(add_jitter(delay))
+        else:
+            self.perception.wait_for_change(add_jitter(delay))
 
     def check_rare_events(self) -> None:
         """Check if the game disconnected or the boat ticket expired."""
-        if self.detection.is_tackle_broken():
-            raise exceptions.TackleBrokenError
-        if self.detection.is_disconnected():
-            raise exceptions.DisconnectedError
-        if self.detection.is_ticket_expired():
-            raise exceptions.TicketExpiredError
-        if self.detection.is_stuck_at_casting():
-            raise exceptions.StuckAtCastingError
+        with self.detection.frame():
+            if self.detection.is_tackle_broken():
+                raise exceptions.TackleBrokenError
+            if self.detection.is_disconnected():
+                raise exceptions.DisconnectedError
+            if self.detection.is_ticket_expired():
+                raise exceptions.TicketExpiredError
+            if self.detection.is_stuck_at_casting():
+                raise exceptions.StuckAtCastingError
 
     def reset(self) -> None:
         """Reset the tackle until ready and detect unexpected events."""
@@ -81,27 +188,12 @@ class Tackle:
             self.stage = StageId.RESET
             self.timer.set_timeout_start_time()
         while True:
-            if self.detection.is_tackle_ready():
+            if self.run_checks(self.reset_plan):
+                self.scheduler.record("reset")
                 return
-            if self.detection.is_fish_hooked():
-                raise exceptions.FishHookedError
-            if self.detection.is_fish_captured():
-                raise exceptions.FishCapturedError
-            if not self.detection.is_bait_chosen():
-                raise exceptions.BaitNotChosenError
-            if self.cfg.BOT.SPOOLING_DETECTION and self.detection.is_line_at_end():
-                raise exceptions.LineAtEndError
-            if self.cfg.BOT.SNAG_DETECTION and self.detection.is_line_snagged():
-                raise exceptions.LineSnaggedError
-            if self.detection.is_lure_broken():
-                raise exceptions.LureBrokenError
-            if self.detection.is_tackle_broken():
-                raise exceptions.TackleBrokenError
-            if not self.detection.is_dry_mix_chosen():
-                raise exceptions.DryMixNotChosenError
             if self.timer.is_rare_event_checkable():
                 self.check_rare_events()
-            sleep(add_jitter(LOOP_DELAY))
+            self.wait_for_change(self.scheduler.get_delay("reset", LOOP_DELAY))
 
     def cast(self, lock: bool) -> None:
         """Cast the rod, then wait for the lure/bait to fly and sink.
@@ -133,18 +225,24 @@ class Tackle:
         logger.info("Sinking lure")
         self.timer.set_timeout_start_time()
         while not self.timer.is_sink_stage_timeout():
-            if self.detection.is_moving_in_bottom_layer():
+            with self.detection.frame():
+                moving_in_bottom_layer = self.detection.is_moving_in_bottom_layer()
+                fish_hooked = (
+                    not moving_in_bottom_layer and self.detection.is_fish_hooked_twice()
+                )
+            if moving_in_bottom_layer:
                 logger.info("Lure has reached bottom layer")
+                self.scheduler.record("sink")  # Before the extra drop below
                 sleep(
                     add_jitter(SINK_DELAY)
                 )  # Drop to the bottom to make the depth consistent
                 self.timer.print_sink_duration()
                 break
 
-            if self.detection.is_fish_hooked_twice():
+            if fish_hooked:
                 pag.click()
                 return
-            sleep(add_jitter(LOOP_DELAY))
+            sleep(add_jitter(self.scheduler.get_delay("sink", LOOP_DELAY)))
         self.hold_mouse_button(self.cfg.PROFILE.TIGHTEN_DURATION)
 
     def retrieve(self) -> None:
@@ -159,20 +257,12 @@ class Tackle:
             self.stage = StageId.RETRIEVE
             self.timer.set_timeout_start_time()
         while True:
-            if self.detection.is_fish_hooked():
-                return
-            if self.detection.is_retrieval_finished():
+            if self.run_checks(self.retrieve_plan):
+                self.scheduler.record("retrieve")
                 return
-
-            if self.detection.is_fish_captured():
-                raise exceptions.FishCapturedError
-            if self.cfg.BOT.SPOOLING_DETECTION and self.detection.is_line_at_end():
-                raise exceptions.LineAtEndError
-            if self.cfg.BOT.SNAG_DETECTION and self.detection.is_line_snagged():
-                raise exceptions.LineSnaggedError
             if self.timer.is_rare_event_checkable():
                 self.check_rare_events()
-            sleep(add_jitter(LOOP_DELAY))
+            self.wait_for_change(self.scheduler.get_delay("retrieve", LOOP_DELAY))
 
     def pull(self) -> None:
         """Retrieve the line until the end is reached and detect unexpected events.
@@ -188,20 +278,16 @@ class Tackle:
             self.timer.set_timeout_start_time()
         while True:
             if self.detection.is_retrieval_finished():
+                self.scheduler.record("pull")
                 return
 
             if self.cfg.ARGS.LIFT:
                 self.hold_mouse_button(LIFT_DURATION, button="right")
 
-            if self.detection.is_fish_captured():
-                raise exceptions.FishCapturedError
-            if self.cfg.BOT.SPOOLING_DETECTION and self.detection.is_line_at_end():
-                raise exceptions.LineAtEndError
-            if self.cfg.BOT.SNAG_DETECTION and self.detection.is_line_snagged():
-                raise exceptions.LineSnaggedError
+            self.run_checks(self.pull_plan)
             if self.timer.is_rare_event_checkable():
                 self.check_rare_events()
-            sleep(add_jitter(LOOP_DELAY))
+            self.wait_for_change(self.scheduler.get_delay("pull", LOOP_DELAY))
             if self.timer.is_coffee_drinkable():
                 raise exceptions.CoffeeTimeoutError
             if self.timer.is_gear_ratio_changeable():
@@ -219,10 +305,8 @@ class Tackle:
             sleep(
                 add_jitter(self.cfg.PROFILE.RETRIEVAL_DELAY, self.cfg.BOT.JITTER_SCALE)
             )
-            if (
-                self.detection.is_fish_hooked()
-                or self.detection.is_retrieval_finished()
-            ):
+            state = self.detection.get_game_state(("fish_hooked", "retrieval_finished"))
+            if state.fish_hooked or state.retrieval_finished:
                 return
 
     def pirk(self) -> None:
@@ -233,10 +317,12 @@ class Tackle:
             self.stage = StageId.PIRK
             self.timer.set_timeout_start_time()
         while not self.timer.is_pirk_stage_timeout():
-            if self.detection.is_tackle_ready():
-                return
+            with self.detection.frame():
+                if self.detection.is_tackle_ready():
+                    return
+                fish_hooked = self.detection.is_fish_hooked_twice()
 
-            if self.detection.is_fish_hooked_twice():
+            if fish_hooked:
                 # If it's enabled, mouse was already pressed by hold_keys() outside
                 if not self.cfg.PROFILE.PIRK_RETRIEVAL:
                     pag.click()
@@ -311,11 +397,10 @@ class Tackle:
     def _lift(self) -> None:
         """Pull the fish until it's captured."""
         while not self.timer.is_lift_stage_timeout():
-            sleep(add_jitter(LOOP_DELAY))
-            if self.detection.is_fish_captured():
+            self.wait_for_change(self.scheduler.get_delay("lift", LOOP_DELAY))
+            if self.run_checks(self.lift_plan):
+                self.scheduler.record("lift")
                 return
-            if self.cfg.BOT.SNAG_DETECTION and self.detection.is_line_snagged():
-                raise exceptions.LineSnaggedError
             if self.timer.is_rare_event_checkable():
                 self.check_rare_events()
             if self.timer.is_coffee_drinkable():
@@ -339,11 +424,10 @@ class Tackle:
             return
 
         while not self.timer.is_lift_stage_timeout():
-            sleep(add_jitter(LOOP_DELAY))
-            if self.detection.is_fish_captured():
+            self.wait_for_change(self.scheduler.get_delay("lift", LOOP_DELAY))
+            if self.run_checks(self.lift_plan):
+                self.scheduler.record("lift")
                 return
-            if self.cfg.BOT.SNAG_DETECTION and self.detection.is_line_snagged():
-                raise exceptions.LineSnaggedError
             if self.timer.is_rare_event_checkable():
                 self.check_rare_events()
             if self.timer.is_coffee_drinkable():
@@ -460,12 +544,11 @@ class Tackle:
     def _monitor_float_state(self) -> None:
         """Monitor the state of the float."""
         logger.info("Monitoring float state")
-        reference_img = pag.screenshot(region=self.detection.float_camera_rect)
-        blurred = reference_img.filter(ImageFilter.GaussianBlur(radius=3))
+        float_monitor = self.detection.get_float_monitor()
         self.timer.set_timeout_start_time()
         while not self.timer.is_drift_stage_timeout():
             sleep(add_jitter(self.cfg.PROFILE.CHECK_DELAY))
-            if self.detection.is_float_state_changed(blurred):
+            if float_monitor.is_changed():
                 logger.info("Float status changed")
                 return
             if self.timer.is_rare_event_checkable():
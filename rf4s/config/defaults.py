@@ -105,6 +105,8 @@ _C.BOT.PAUSE_DURATION = 600
 _C.BOT.CLICK_LOCK = False
 # Global jitter time scale for delays (delay = delay +- delay * jitter)
 _C.BOT.JITTER_SCALE = 0.2
+# Game state checks per second of the background perception thread, 0 to disable it
+_C.BOT.PERCEPTION_RATE = 4.0
 
 
 # ---------------------------------------------------------------------------- #
@@ -140,10 +142,65 @@ _C.BOT.KEEPNET.WHITELIST = (
 _C.BOT.KEEPNET.KEEP_TAGS = ("green", "yellow", "blue", "purple", "pink")
 
 
+# ---------------------------------------------------------------------------- #
+#                              Screenshot Settings                             #
+# ---------------------------------------------------------------------------- #
+_C.BOT.SCREENSHOT = CN()
+# Image format of saved and sent screenshots (options: png, jpeg, webp)
+_C.BOT.SCREENSHOT.FORMAT = "png"
+# PNG compression level, higher = smaller but slower (0-9)
+_C.BOT.SCREENSHOT.PNG_COMPRESSION = 6
+# JPEG and WebP quality, higher = larger but sharper (1-100)
+_C.BOT.SCREENSHOT.QUALITY = 90
+# Crop screenshots of caught fish to the catch card
+_C.BOT.SCREENSHOT.CROP_TO_CATCH = False
+# Downscale screenshots so that the longer side doesn't exceed it, 0 to disable it
+_C.BOT.SCREENSHOT.MAX_DIMENSION = 0
+
+
+# ---------------------------------------------------------------------------- #
+#                            Flight Recorder Settings                          #
+# ---------------------------------------------------------------------------- #
+# Recent frames kept in memory and saved under logs/ when a failure occurs
+_C.BOT.FLIGHT_RECORDER = CN()
+# Frames per second, 0 to disable it
+_C.BOT.FLIGHT_RECORDER.RATE = 2.0
+# Memory budget in MB, it determines how long the history is
+_C.BOT.FLIGHT_RECORDER.MEMORY = 64
+# Downscale frames so that the longer side doesn't exceed it, 0 to keep the size
+_C.BOT.FLIGHT_RECORDER.MAX_DIMENSION = 480
+
+
+# ---------------------------------------------------------------------------- #
+#                           Session Recorder Settings                          #
+# ---------------------------------------------------------------------------- #
+# Record the game window and detection results under logs/ for offline replay
+_C.BOT.SESSION_RECORDER = CN()
+# Frames per second, 0 to disable it
+_C.BOT.SESSION_RECORDER.RATE = 0.0
+# zstd compression level, higher = smaller but slower (1-22)
+_C.BOT.SESSION_RECORDER.COMPRESSION_LEVEL = 3
+# Downscale frames so that the longer side doesn't exceed it, 0 to keep the size
+_C.BOT.SESSION_RECORDER.MAX_DIMENSION = 0
+
+
 # ---------------------------------------------------------------------------- #
 #                             Notification Settings                            #
 # ---------------------------------------------------------------------------- #
 _C.BOT.NOTIFICATION = CN()
+# Number of threads sending notifications in the background
+_C.BOT.NOTIFICATION.WORKERS = 4
+# Timeouts of connecting to and waiting for a response from a notification channel
+_C.BOT.NOTIFICATION.CONNECT_TIMEOUT = 5.0
+_C.BOT.NOTIFICATION.READ_TIMEOUT = 10.0
+# Maximum retries of a failed or rate-limited request to Discord, Telegram or Miaotixing
+_C.BOT.NOTIFICATION.MAX_RETRIES = 3
+# Maximum time to wait for pending notifications when the script stops
+_C.BOT.NOTIFICATION.FLUSH_TIMEOUT = 30.0
+# Number of screenshots sent together with a result summary, 0 to send them one by one
+_C.BOT.NOTIFICATION.DIGEST_SIZE = 0
+# Maximum time to hold screenshots before sending an incomplete digest
+_C.BOT.NOTIFICATION.DIGEST_WINDOW = 600
 # Email
 _C.BOT.NOTIFICATION.EMAIL = "email@example.com"
 _C.BOT.NOTIFICATION.PASSWORD = "password"
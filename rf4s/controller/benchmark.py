@@ -0,0 +1,170 @@
+"""Micro-benchmark of detection predicates on labelled recorded frames.
+
+The dataset contains a directory for each resolution. Each directory holds the
+frames (PNG screenshots of the game window) and a labels.json that maps a frame
+name to the expected result of the predicates on it, e.g.:
+
+    dataset/
+        1920x1080/
+            0001.png
+            labels.json  # {"0001.png": {"is_tackle_ready": true, ...}, ...}
+
+Usage: python -m rf4s.controller.benchmark dataset [-r REPEAT] [-p PROFILE]
+"""
+
+import argparse
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from rich import box, print
+from rich.table import Table
+from yacs.config import CfgNode as CN
+
+from rf4s import config
+from rf4s.controller.detection import Detection
+from rf4s.controller.replay import ReplayCapture, ReplayWindow
+
+RESOLUTIONS = ("1600x900", "1920x1080", "2560x1440")
+LABEL_FILENAME = "labels.json"
+
+
+@dataclass
+class PredicateStats:
+    """Latencies and correctness of a predicate."""
+
+    latencies: list[float] = field(default_factory=list)
+    hits: int = 0
+    misses: int = 0
+    failed_frames: list[str] = field(default_factory=list)
+
+    def add(self, frame_name: str, latencies: list[float], correct: bool) -> None:
+        self.latencies.extend(latencies)
+        if correct:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.failed_frames.append(frame_name)
+
+
+def setup_cfg(profile: str, language: str) -> CN:
+    """Set up a bot configuration with the given profile.
+
+    :param profile: Name of the profile in the default configuration.
+    :type profile: str
+    :param language: Language of the game.
+    :type language: str
+    :return: Configuration node.
+    :rtype: CN
+    """
+    cfg = config.get_cfg_defaults()
+    cfg.set_new_allowed(True)
+    cfg.LANGUAGE = language
+    cfg.ARGS = CN({"FEATURE": "bot", "RAINBOW": None})
+    cfg.PROFILE = cfg.PROFILE[profile.upper()]
+    return cfg
+
+
+def benchmark_resolution(
+    cfg: CN, frame_dir: Path, repeat: int
+) -> dict[str, PredicateStats]:
+    """Run every labelled predicate on every frame of a resolution.
+
+    :param cfg: Configuration node.
+    :type cfg: CN
+    :param frame_dir: Directory containing the frames and labels.
+    :type frame_dir: Path
+    :param repeat: Number of timed calls per predicate and frame.
+    :type repeat: int
+    :return: Statistics of each predicate.
+    :rtype: dict[str, PredicateStats]
+    """
+    with open(frame_dir / LABEL_FILENAME, "r", encoding="utf-8") as file:
+        labels = json.load(file)
+
+    capture = ReplayCapture(frame_dir)
+    detection = Detection(cfg, ReplayWindow.from_capture(capture), capture)
+    stats = {}
+    for name in capture:
+        for predicate, expected in labels.get(name, {}).items():
+            func = getattr(detection, predicate)
+            latencies = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = func()
+                latencies.append(time.perf_counter() - start)
+            stats.setdefault(predicate, PredicateStats()).add(
+                name, latencies, bool(result) == expected
+            )
+    return stats
+
+
+def print_report(resolution: str, stats: dict[str, PredicateStats]) -> None:
+    """Print the latency percentiles, throughput and correctness of predicates.
+
+    :param resolution: Resolution of the frames.
+    :type resolution: str
+    :param stats: Statistics of each predicate.
+    :type stats: dict[str, PredicateStats]
+    """
+    table = Table(
+        "Predicate",
+        "p50 (ms)",
+        "p95 (ms)",
+        "p99 (ms)",
+        "Matches/s",
+        "Hit",
+        "Miss",
+        title=f"Detection benchmark ({resolution})",
+        box=box.HEAVY,
+    )
+    for predicate, predicate_stats in sorted(stats.items()):
+        latencies = np.array(predicate_stats.latencies) * 1000
+        p50, p95, p99 = np.percentile(latencies, (50, 95, 99))
+        table.add_row(
+            predicate,
+            f"{p50:.2f}",
+            f"{p95:.2f}",
+            f"{p99:.2f}",
+            f"{1000 / latencies.mean():.1f}",
+            str(predicate_stats.hits),
+            str(predicate_stats.misses),
+        )
+    print(table)
+    for predicate, predicate_stats in sorted(stats.items()):
+        if predicate_stats.failed_frames:
+            frames = ", ".join(predicate_stats.failed_frames)
+            print(f"[red]{predicate} failed on: {frames}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark detection predicates on labelled recorded frames."
+    )
+    parser.add_argument("dataset", type=Path, help="dataset directory")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=20, help="timed calls per frame"
+    )
+    parser.add_argument(
+        "-p", "--profile", default="spin", help="profile in the default config"
+    )
+    parser.add_argument("-l", "--language", default="en", help="game language")
+    args = parser.parse_args()
+
+    cfg = setup_cfg(args.profile, args.language)
+    misses = 0
+    for resolution in RESOLUTIONS:
+        frame_dir = args.dataset / resolution
+        if not (frame_dir / LABEL_FILENAME).exists():
+            continue
+        stats = benchmark_resolution(cfg, frame_dir, args.repeat)
+        print_report(resolution, stats)
+        misses += sum(s.misses for s in stats.values())
+    # Non-zero exit status on wrong results, so it can be used as a regression check
+    raise SystemExit(1 if misses else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Screen capture backends."""
+
+import threading
+from abc import ABC, abstractmethod
+
+import cv2
+import mss
+import numpy as np
+from PIL import Image
+
+
+class Frame:
+    """A captured region of the screen.
+
+    Pixels are kept in the BGRA buffer returned by mss without copying, and crops
+    are numpy views into it. All coordinates are absolute screen coordinates.
+
+    Attributes:
+        bgra (np.ndarray): BGRA pixels with shape (height, width, 4).
+        left (int): Absolute x coordinate of the top-left corner.
+        top (int): Absolute y coordinate of the top-left corner.
+    """
+
+    def __init__(self, bgra: np.ndarray, left: int, top: int):
+        """Wrap a BGRA array captured at the given position.
+
+        :param bgra: BGRA pixels with shape (height, width, 4).
+        :type bgra: np.ndarray
+        :param left: Absolute x coordinate of the top-left corner.
+        :type left: int
+        :param top: Absolute y coordinate of the top-left corner.
+        :type top: int
+        """
+        self.bgra = bgra
+        self.left = left
+        self.top = top
+        self._gray = None
+
+    @property
+    def width(self) -> int:
+        return self.bgra.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.bgra.shape[0]
+
+    @property
+    def bgr(self) -> np.ndarray:
+        """BGR view of the pixels, without copying."""
+        return self.bgra[..., :3]
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Grayscale pixels, converted once and cached."""
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.bgra, cv2.COLOR_BGRA2GRAY)
+        return self._gray
+
+    def pixel(self, x: int, y: int) -> tuple[int, int, int]:
+        """Get the RGB color of a pixel.
+
+        :param x: Absolute x coordinate.
+        :type x: int
+        :param y: Absolute y coordinate.
+        :type y: int
+        :return: RGB color of the pixel.
+        :rtype: tuple[int, int, int]
+        """
+        b, g, r, _ = self.bgra[y - self.top, x - self.left]
+        return int(r), int(g), int(b)
+
+    def crop(self, region: tuple | list) -> "Frame":
+        """Get a view of a region of the frame.
+
+        :param region: Absolute region (left, top, width, height).
+        :type region: tuple | list
+        :return: Cropped frame sharing the same buffer.
+        :rtype: Frame
+        """
+        left, top, width, height = region
+        # Clip the region to the frame
+        x, y = max(left - self.left, 0), max(top - self.top, 0)
+        right, bottom = left + width - self.left, top + height - self.top
+        return Frame(self.bgra[y:bottom, x:right], self.left + x, self.top + y)
+
+    def to_image(self) -> Image.Image:
+        """Convert the frame to a PIL image, e.g., for saving or blurring.
+
+        :return: RGB image of the frame.
+        :rtype: Image.Image
+        """
+        return Image.fromarray(np.ascontiguousarray(self.bgra[..., 2::-1]))
+
+
+class CaptureBackend(ABC):
+    """Interface of the screen capture used by Detection."""
+
+    @abstractmethod
+    def grab(self, region: tuple | list | None = None) -> Frame:
+        """Capture a region of the screen.
+
+        :param region: Absolute region (left, top, width, height), defaults to None
+            (the whole screen).
+        :type region: tuple | list | None, optional
+        :return: Captured frame.
+        :rtype: Frame
+        """
+
+
+class MssCapture(CaptureBackend):
+    """Screen capture with a persistent mss handle.
+
+    mss handles can't be shared between threads, so each thread opens its own one
+    lazily. The handles are not pickled, so the instance can be passed to a child
+    process (e.g., the friction brake monitor).
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _get_sct(self) -> mss.base.MSSBase:
+        """Get the mss handle of the current thread, opening it on first use.
+
+        :return: mss handle.
+        :rtype: mss.base.MSSBase
+        """
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._local.sct = mss.mss()
+        return sct
+
+    def grab(self, region: tuple | list | None = None) -> Frame:
+        sct = self._get_sct()
+        if region is None:
+            monitor = sct.monitors[0]
+        else:
+            keys = ("left", "top", "width", "height")
+            monitor = dict(zip(keys, map(int, region)))  # No numpy integers
+        shot = sct.grab(monitor)
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4
+        )
+        return Frame(bgra, shot.left, shot.top)
@@ -1,19 +1,25 @@
 """Helper functions for image detection."""
 
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
 from functools import partial
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Callable, Generator, Iterable
 
-import pyautogui as pag
-from PIL import Image, ImageFilter
-from pyscreeze import Box
+import cv2
+import numpy as np
+from pyscreeze import Box, locate, locateAll
 
 from rf4s import utils
-from rf4s.controller.window import Window
+from rf4s.controller.capture import CaptureBackend, Frame, MssCapture
+from rf4s.controller.template import TemplateRegistry
 from rf4s.utils import add_jitter
 
+if TYPE_CHECKING:
+    from rf4s.controller.window import Window
+
 CRITICAL_COLOR = (206, 56, 21)
 WARNING_COLOR = (227, 149, 23)
 
@@ -26,9 +32,30 @@ CAMERA_OFFSET = 40
 SIDE_LENGTH = 160
 SIDE_LENGTH_HALF = 80
 ORANGE_REEL = (227, 149, 23)
+STAT_BAR_LENGTH = 152
+STAT_BAR_STARTS = {"energy": 19, "food": 18, "comfort": 18}  # From the icon center
+STAT_ICON_MARGIN = 8  # Slack of the crop used to verify a cached icon position
+FLOAT_CAMERA_DOWNSCALE = 4  # Area averaging, also smooths out the water noise
+FLOAT_BACKGROUND_LEARNING_RATE = 0.05
+LURE_MODES = ("spin", "pirk", "elevator")  # Modes without a bait slot
 
 ROOT = Path(__file__).resolve().parents[2]
 
+# The UI keeps its pixel size between the supported 16:9 layouts (only the offsets
+# in COORD_OFFSETS shift), and is scaled outside of this range of heights.
+MIN_UNSCALED_HEIGHT = 900
+MAX_UNSCALED_HEIGHT = 1440
+
+# Order of the points in the HUD probe bank
+HUD_PROBES = (
+    "fish_icon",
+    "clip_icon",
+    "spool_icon",
+    "snag_icon",
+    "reel_burning_icon",
+    "friction_brake",
+)
+
 
 class TagColor(Enum):
     GREEN = "green_tag"
@@ -38,6 +65,131 @@ class TagColor(Enum):
     PURPLE = "purple_tag"
 
 
+@dataclass
+class HudStatus:
+    """States of the HUD icons read from a single capture."""
+
+    fish_hooked: bool
+    clip_open: bool
+    line_at_end: bool
+    line_snagged: bool
+    reel_burning: bool
+    friction_brake_high: bool
+
+
+class FloatMonitor:
+    """Change detector of the float camera based on a running background model.
+
+    Each sample is compared with the background by the correlation coefficient,
+    the same metric locate() used on the blurred reference image, so the float
+    sensitivity keeps its meaning. The background slowly follows the samples that
+    don't change, e.g., light and waves. A float that sinks slowly would be absorbed
+    into it, so each sample is also compared with the first one, taken at cast time.
+
+    Attributes:
+        get_sample (Callable[[], np.ndarray]): Function to get a grayscale sample.
+        sensitivity (float): Minimum correlation for the float to be unchanged.
+        reference (np.ndarray): First sample, taken when the float has settled.
+        background (np.ndarray): Running background model.
+    """
+
+    def __init__(self, get_sample: Callable[[], np.ndarray], sensitivity: float):
+        """Take the first sample as the reference and the background.
+
+        :param get_sample: Function to get a grayscale sample of the float camera.
+        :type get_sample: Callable[[], np.ndarray]
+        :param sensitivity: Minimum correlation for the float to be unchanged.
+        :type sensitivity: float
+        """
+        self.get_sample = get_sample
+        self.sensitivity = sensitivity
+        self.reference = self._get_sample()
+        self.background = self.reference.copy()
+
+    def _get_sample(self) -> np.ndarray:
+        gray = self.get_sample()
+        height, width = gray.shape
+        size = (width // FLOAT_CAMERA_DOWNSCALE, height // FLOAT_CAMERA_DOWNSCALE)
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA).astype(np.float32)
+
+    @staticmethod
+    def get_score(sample: np.ndarray, model: np.ndarray) -> float:
+        """Get the correlation coefficient between a sample and a model.
+
+        :param sample: Downscaled sample.
+        :type sample: np.ndarray
+        :param model: Reference or background model.
+        :type model: np.ndarray
+        :return: Correlation coefficient, 1.0 if both are flat.
+        :rtype: float
+        """
+        a = sample - sample.mean()
+        b = model - model.mean()
+        denominator = np.sqrt((a * a).sum() * (b * b).sum())
+        if denominator == 0:
+            return 1.0
+        return float((a * b).sum() / denominator)
+
+    def is_changed(self) -> bool:
+        """Take a sample and check if the float state is changed.
+
+        :return: True if the float state is changed, False otherwise.
+        :rtype: bool
+        """
+        sample = self._get_sample()
+        if (
+            self.get_score(sample, self.background) < self.sensitivity
+            or self.get_score(sample, self.reference) < self.sensitivity
+        ):
+            return True
+        cv2.accumulateWeighted(sample, self.background, FLOAT_BACKGROUND_LEARNING_RATE)
+        return False
+
+
+# Flags of GameState that are read from the HUD probe bank
+HUD_FLAGS = ("fish_hooked", "line_at_end", "line_snagged", "clip_open")
+
+# Flags of GameState that are set if a template is found: (image, confidence)
+STATE_TEMPLATES = {
+    "fish_captured": ("keep", 0.9),
+    "tackle_ready": ("ready", 0.6),
+    "tackle_broken": ("broke", 0.8),
+    "lure_broken": ("lure_is_broken", 0.8),
+    "moving_in_bottom_layer": ("movement", 0.7),
+    "dry_mix_missing": ("groundbait_is_not_chosen", 0.8),
+}
+
+
+class GameState:
+    """Snapshot of the game perceived from a single frame.
+
+    Flags that are not requested are left as None.
+    """
+
+    __slots__ = (
+        "fish_hooked",
+        "fish_captured",
+        "tackle_ready",
+        "retrieval_finished",
+        "line_at_end",
+        "line_snagged",
+        "clip_open",
+        "tackle_broken",
+        "lure_broken",
+        "bait_missing",
+        "dry_mix_missing",
+        "moving_in_bottom_layer",
+    )
+
+    def __init__(self, **flags: bool):
+        for name in self.__slots__:
+            setattr(self, name, flags.get(name))
+
+    def __repr__(self) -> str:
+        flags = (f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"GameState({', '.join(flags)})"
+
+
 COORD_OFFSETS = {
     "1600x900": {
         "friction_brake_very_high": (502, 872),  # Left point only
@@ -80,6 +232,42 @@ COORD_OFFSETS = {
     },
 }
 
+# Search regions (left, top, width, height) of templates relative to the game window.
+# The HUD is anchored at the bottom center and the catch card at the center, so
+# the regions are shifted in the same way as COORD_OFFSETS between resolutions.
+# Templates without a region, or unsupported window sizes, use full-screen search.
+TEMPLATE_REGIONS = {
+    "1600x900": {
+        "hint": (240, 480, 1120, 420),
+        "spool": (740, 700, 620, 200),
+        "catch": (200, 0, 1200, 900),
+        "center": (320, 0, 960, 900),
+    },
+    "1920x1080": {
+        "hint": (400, 660, 1120, 420),
+        "spool": (900, 880, 620, 200),
+        "catch": (360, 90, 1200, 900),
+        "center": (480, 0, 960, 1080),
+    },
+    "2560x1440": {
+        "hint": (720, 1020, 1120, 420),
+        "spool": (1220, 1240, 620, 200),
+        "catch": (680, 270, 1200, 900),
+        "center": (800, 0, 960, 1440),
+    },
+}
+
+TEMPLATE_AREAS = {
+    "ready": "hint",
+    "movement": "hint",
+    "wheel": "spool",
+    "0m": "spool",
+    "5m": "spool",
+    "keep": "catch",
+    "cast": "center",
+    **{tag.value: "catch" for tag in TagColor},
+}
+
 # ------------------------ Friction brake coordinates ------------------------ #
 # ----------------------------- 900p - 1080p - 2k ---------------------------- #
 # ------ left - red - yellow - center(left + 424) - yellow - red - right ----- #
@@ -90,6 +278,24 @@ COORD_OFFSETS = {
 # "2560x1440": {"x": (855, 960, 1066, 1279, 1491, 1598, 1702), "y": 1412},
 
 
+def get_template_scale(width: int, height: int) -> float:
+    """Get the scale of the game UI relative to the reference images.
+
+    :param width: Width of the game window.
+    :type width: int
+    :param height: Height of the game window.
+    :type height: int
+    :return: Scale factor of the reference images.
+    :rtype: float
+    """
+    height = min(height, width * 9 / 16)  # Height of the 16:9 area
+    if height < MIN_UNSCALED_HEIGHT:
+        return height / MIN_UNSCALED_HEIGHT
+    if height > MAX_UNSCALED_HEIGHT:
+        return height / MAX_UNSCALED_HEIGHT
+    return 1.0
+
+
 class Detection:
     """A class that holds different aliases of locateOnScreen(image).
 
@@ -100,24 +306,68 @@ class Detection:
         cfg (CfgNode): Configuration node for the detection settings.
         window (Window): Game window controller instance.
         image_dir (Path): Directory containing reference images for detection.
+        templates (TemplateRegistry): Decoded reference images keyed by name.
         coord_offsets (dict): Dictionary of coordinate offsets for different window sizes.
-        bait_icon_reference_img (Image): Reference image for bait icon detection.
+        template_regions (dict): Absolute search regions keyed by area name.
+        capture (CaptureBackend): Screen capture backend.
+        capture_rect (tuple | None): Region captured by a frame, the game window if its
+            size is supported, otherwise the full screen.
+        _frame (Frame | None): Screenshot shared by all checks in the current frame.
+        _hud_status (HudStatus | None): HUD status of the current frame.
+        _stat_anchors (dict): Centers of the stat icons keyed by name.
+        _stat_anchor_window_box (tuple | None): Window box the anchors belong to.
     """
 
-    def __init__(self, cfg, window: Window):
+    def __init__(self, cfg, window: "Window", capture: CaptureBackend | None = None):
         """Initialize the Detection class with configuration and window settings.
 
         :param cfg: Configuration node for detection settings.
         :type cfg: CfgNode
         :param window: Game window controller instance.
         :type window: Window
+        :param capture: Screen capture backend, defaults to None (live screen).
+        :type capture: CaptureBackend | None, optional
         """
         self.cfg = cfg
         self.window = window
         self.image_dir = ROOT / "static" / cfg.LANGUAGE
+        self.templates = TemplateRegistry(
+            self.image_dir, get_template_scale(*window.get_box()[2:])
+        )
+        self.capture = capture or MssCapture()
+        self.capture_rect = None  # Full screen
+        self._frame = None
+        self._hud_status = None
+        self._stat_anchors = {}
+        self._stat_anchor_window_box = None
+        self.template_regions = {}
 
         if window.is_size_supported():
+            self.capture_rect = window.get_box()
             self._set_absolute_coords()
+        self._bind_is_fish_hooked()
+
+    def __copy__(self) -> "Detection":
+        """Copy the instance for another thread.
+
+        Templates and coordinates are read-only and shared, but the copy gets its own
+        frame state, and is_fish_hooked is bound to the copy instead of the original.
+
+        :return: Shallow copy of the instance.
+        :rtype: Detection
+        """
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other._frame = None
+        other._hud_status = None
+        other._stat_anchors = {}
+        other._stat_anchor_window_box = None
+        other._bind_is_fish_hooked()
+        return other
+
+    def _bind_is_fish_hooked(self) -> None:
+        """Select the pixel check or the template fallback of is_fish_hooked."""
+        if self.window.is_size_supported():
             self.is_fish_hooked = self.is_fish_hooked_pixel
         else:
             self.is_fish_hooked = partial(
@@ -126,12 +376,64 @@ class Detection:
                 confidence="0.9",
             )
 
-        self.bait_icon_reference_img = Image.open(self.image_dir / "bait_icon.png")
+    @contextmanager
+    def frame(self) -> Generator[None, None, None]:
+        """Capture the screen once and share it with every check inside the block.
+
+        Without an active frame, each check takes its own screenshot. A nested block
+        takes a fresh capture and restores the outer one on exit, so a check that
+        must look at the screen again (e.g., after a delay) can open its own frame.
+        """
+        outer_frame, outer_hud_status = self._frame, self._hud_status
+        self._frame = self.capture.grab(self.capture_rect)
+        self._hud_status = None
+        try:
+            yield
+        finally:
+            self._frame, self._hud_status = outer_frame, outer_hud_status
+
+    def _grab(self, region: tuple | list | None = None) -> Frame:
+        """Get a region from the active frame, or capture it if there's none.
+
+        :param region: Absolute region (left, top, width, height), defaults to None
+            (the whole capture area).
+        :type region: tuple | list | None, optional
+        :return: Frame of the region.
+        :rtype: Frame
+        """
+        if self._frame is None:
+            return self.capture.grab(region or self.capture_rect)
+        if region is None:
+            return self._frame
+        return self._frame.crop(region)
+
+    def get_window_frame(self) -> Frame:
+        """Get the game window from the active frame, or capture it if there's none.
+
+        :return: Frame of the game window.
+        :rtype: Frame
+        """
+        return self._grab(self.window.get_box())
+
+    def get_catch_frame(self) -> Frame:
+        """Get the catch card, or the whole game window if its region is unknown.
+
+        :return: Frame of the catch card.
+        :rtype: Frame
+        """
+        return self._grab(self.template_regions.get("catch", self.window.get_box()))
 
     def _get_image_box(
-        self, image: str, confidence: float, multiple: bool = False
+        self,
+        image: str,
+        confidence: float,
+        multiple: bool = False,
+        area: str | None = None,
     ) -> Box | Generator[Box, None, None] | None:
-        """A wrapper for locateOnScreen method and path resolving.
+        """A wrapper for locateOnScreen method using preloaded templates.
+
+        If a frame is active, the image is located in it instead of a new screenshot.
+        If the template has a search region, only that region is matched.
 
         :param image: Base name of the image.
         :type image: str
@@ -139,13 +441,139 @@ class Detection:
         :type confidence: float
         :param multiple: Whether to locate all matching images, defaults to False.
         :type multiple: bool, optional
-        :return: Image box, None if not found.
+        :param area: Search area name, defaults to the one in TEMPLATE_AREAS.
+        :type area: str | None, optional
+        :return: Image box in screen coordinates, None if not found.
         :rtype: Box | None
         """
-        image_path = str(self.image_dir / f"{image}.png")
+        frame = self._grab(self.template_regions.get(area or TEMPLATE_AREAS.get(image)))
+        boxes = (
+            Box(box.left + frame.left, box.top + frame.top, box.width, box.height)
+            for box in locateAll(
+                self.templates.get(image), frame.gray, confidence=confidence
+            )
+        )
         if multiple:
-            return pag.locateAllOnScreen(image_path, confidence=confidence)
-        return pag.locateOnScreen(image_path, confidence=confidence)
+            return boxes
+        return next(boxes, None)
+
+    def get_image_boxes(
+        self, images: dict[str, float], area: str | None = None
+    ) -> dict[str, Box | None]:
+        """Locate several templates in one capture of a search area.
+
+        The area is captured and converted to grayscale once, then every template
+        is matched against the same array.
+
+        :param images: Base names of the images mapped to their matching confidence.
+        :type images: dict[str, float]
+        :param area: Search area name, defaults to None (whole capture area).
+        :type area: str | None, optional
+        :return: Image box of each image, None if not found.
+        :rtype: dict[str, Box | None]
+        """
+        frame = self._grab(self.template_regions.get(area))
+        boxes = {}
+        for image, confidence in images.items():
+            box = locate(self.templates.get(image), frame.gray, confidence=confidence)
+            if box is not None:
+                box = Box(box.left + frame.left, box.top + frame.top, *box[2:])
+            boxes[image] = box
+        return boxes
+
+    def get_game_state(self, flags: Iterable[str] = GameState.__slots__) -> GameState:
+        """Perceive the requested flags of the game state from one frame.
+
+        All templates are grouped by search area and matched in one batch per area.
+        If there's no active frame, a frame is captured for the snapshot.
+
+        :param flags: Names of the flags to perceive, defaults to all of them.
+        :type flags: Iterable[str], optional
+        :return: Snapshot of the game state.
+        :rtype: GameState
+        """
+        if self._frame is None:
+            with self.frame():
+                return self.get_game_state(flags)
+
+        flags = set(flags)
+        images = dict(STATE_TEMPLATES[flag] for flag in flags & STATE_TEMPLATES.keys())
+        spool_images = self._get_spool_images()
+        if "retrieval_finished" in flags:
+            images["ready"] = STATE_TEMPLATES["tackle_ready"][1]
+            images.update(dict.fromkeys(spool_images, self.cfg.BOT.SPOOL_CONFIDENCE))
+        supported = self.window.is_size_supported()
+        if "fish_hooked" in flags and not supported:
+            images["fish_icon"] = 0.9
+
+        areas = {}
+        for image, confidence in images.items():
+            areas.setdefault(TEMPLATE_AREAS.get(image), {})[image] = confidence
+        boxes = {}
+        for area, area_images in areas.items():
+            boxes.update(self.get_image_boxes(area_images, area))
+
+        def is_found(image: str) -> bool:
+            return boxes.get(image) is not None
+
+        state = GameState()
+        for flag in flags & STATE_TEMPLATES.keys():
+            setattr(state, flag, is_found(STATE_TEMPLATES[flag][0]))
+        if "retrieval_finished" in flags:
+            state.retrieval_finished = is_found("ready") or any(
+                is_found(image) for image in spool_images
+            )
+        if supported and flags.intersection(HUD_FLAGS):
+            hud_status = self.get_hud_status()
+            for flag in flags.intersection(HUD_FLAGS):
+                setattr(state, flag, getattr(hud_status, flag))
+        elif "fish_hooked" in flags:
+            state.fish_hooked = is_found("fish_icon")
+        if "bait_missing" in flags:
+            state.bait_missing = not self.is_bait_chosen()
+        return state
+
+    def get_flag(self, flag: str) -> bool:
+        """Perceive a single flag of the game state.
+
+        :param flag: Name of the flag.
+        :type flag: str
+        :return: Value of the flag.
+        :rtype: bool
+        """
+        return getattr(self.get_game_state((flag,)), flag)
+
+    def get_hud_status(self) -> HudStatus:
+        """Read all HUD icons from one capture of the strip that covers them.
+
+        Inside a frame, the status is computed once and shared by every check.
+
+        :return: States of the HUD icons.
+        :rtype: HudStatus
+        """
+        if self._hud_status is not None:
+            return self._hud_status
+
+        strip = self._grab(self.hud_strip).bgra
+        # BGRA -> RGB
+        fish, clip, spool, snag, reel, friction_brake = strip[
+            self.hud_probe_ys, self.hud_probe_xs, 2::-1
+        ].astype(np.int16)
+        hud_status = HudStatus(
+            fish_hooked=bool((fish > MIN_GRAY_SCALE_LEVEL).all()),
+            clip_open=not (clip > MIN_GRAY_SCALE_LEVEL).all(),
+            line_at_end=bool(
+                (spool == (WARNING_COLOR, CRITICAL_COLOR)).all(axis=1).any()
+            ),
+            line_snagged=bool((snag == CRITICAL_COLOR).all()),
+            reel_burning=bool((reel == ORANGE_REEL).all()),
+            friction_brake_high=bool(
+                (abs(friction_brake - RED_FRICTION_BRAKE) <= COLOR_TOLERANCE).all()
+            ),
+        )
+        if self._frame is not None:
+            self._hud_status = hud_status
+        return hud_status
 
     def _set_absolute_coords(self) -> None:
         """Add offsets to the base coordinates to get absolute ones."""
@@ -162,6 +590,21 @@ class Detection:
         friction_brake_key = f"friction_brake_{sensitivity}"
         self.friction_brake_coord = self._get_absolute_coord(friction_brake_key)
 
+        # Bounding strip of all HUD probes and the probe positions relative to it
+        coords = np.array([getattr(self, f"{key}_coord") for key in HUD_PROBES])
+        left, top = coords.min(axis=0)
+        width, height = coords.max(axis=0) - coords.min(axis=0) + 1
+        self.hud_strip = (int(left), int(top), int(width), int(height))
+        self.hud_probe_xs, self.hud_probe_ys = (coords - (left, top)).T
+
+        box = self.window.get_box()
+        self.template_regions = {
+            area: (box[0] + left, box[1] + top, width, height)
+            for area, (left, top, width, height) in TEMPLATE_REGIONS[
+                self.window.get_resolution_str()
+            ].items()
+        }
+
         bases = self._get_absolute_coord("float_camera")
         if hasattr(self.cfg.PROFILE, "MODE") and self.cfg.PROFILE.MODE in (
             "telescopic",
@@ -199,81 +642,81 @@ class Detection:
     # blue: 104, 165, 251
     # purple: 130, 126, 252
 
-    def is_tag_exist(self, color: TagColor):
-        return self._get_image_box(color.value, 0.95)
+    def get_catch_matches(self, fish_species_list: tuple | list) -> dict:
+        """Match all tags and the given fish species on the catch card in one pass.
 
-    def is_fish_species_matched(self, species: str):
-        return self._get_image_box(species, 0.9)
+        :param fish_species_list: fish species list
+        :type fish_species_list: tuple | list
+        :return: Image box of each tag and species, None if not found.
+        :rtype: dict[str, Box | None]
+        """
+        images = {tag.value: 0.95 for tag in TagColor}
+        images.update(dict.fromkeys(fish_species_list, 0.9))
+        return self.get_image_boxes(images, area="catch")
 
     # -------------------------------- Fish status ------------------------------- #
     def is_fish_hooked(self):
         pass  # It's initialized in the constructor
 
     def is_fish_hooked_pixel(self) -> bool:
-        return all(c > MIN_GRAY_SCALE_LEVEL for c in pag.pixel(*self.fish_icon_coord))
+        return self.get_hud_status().fish_hooked
 
     def is_fish_hooked_twice(self) -> bool:
         if not self.is_fish_hooked():
             return False
 
         time.sleep(add_jitter(self.cfg.PROFILE.HOOK_DELAY, self.cfg.BOT.JITTER_SCALE))
-        if self.is_fish_hooked():
-            return True
+        with self.frame():  # The outer frame is outdated after the delay
+            if self.is_fish_hooked():
+                return True
         return False
 
     def is_fish_captured(self):
-        return self._get_image_box("keep", 0.9)
+        return self._get_image_box(*STATE_TEMPLATES["fish_captured"])
 
-    def is_fish_in_list(self, fish_species_list: tuple | list) -> bool:
-        """Check if the fish species matches any in the table.
+    # ---------------------------- Retrieval detection --------------------------- #
+    def _get_spool_images(self) -> tuple[str, ...]:
+        """Get the images that indicate the line is retrieved.
 
-        :param fish_species_list: fish species list
-        :type fish_species_list: tuple | list
-        :return: True if the fish species matches, False otherwise
-        :rtype: bool
+        :return: Base names of the images.
+        :rtype: tuple[str, ...]
         """
-        for species in fish_species_list:
-            if self.is_fish_species_matched(species):
-                return True
-        return False
+        if self.cfg.ARGS.RAINBOW is None:
+            return ("wheel",)
+        elif self.cfg.ARGS.RAINBOW == 0:
+            return ("0m",)
+        else:  # self.cfg.ARGS.RAINBOW = 5, detect 0m or 5m
+            return ("5m", "0m")
 
-    # ---------------------------- Retrieval detection --------------------------- #
     def is_retrieval_finished(self):
         if self.is_tackle_ready():
             return True
-
-        if self.cfg.ARGS.RAINBOW is None:
-            return self._get_image_box("wheel", self.cfg.BOT.SPOOL_CONFIDENCE)
-        elif self.cfg.ARGS.RAINBOW == 0:
-            return self._get_image_box("0m", self.cfg.BOT.SPOOL_CONFIDENCE)
-        else:  # self.cfg.ARGS.RAINBOW = 5, detect 0m or 5m
-            return self._get_image_box(
-                "5m", self.cfg.BOT.SPOOL_CONFIDENCE
-            ) or self._get_image_box("0m", self.cfg.BOT.SPOOL_CONFIDENCE)
+        return any(
+            self._get_image_box(image, self.cfg.BOT.SPOOL_CONFIDENCE)
+            for image in self._get_spool_images()
+        )
 
     def is_line_snagged(self) -> bool:
-        return pag.pixel(*self.snag_icon_coord) == CRITICAL_COLOR
+        return self.get_hud_status().line_snagged
 
     def is_line_at_end(self) -> bool:
-        return pag.pixel(*self.spool_icon_coord) in (WARNING_COLOR, CRITICAL_COLOR)
+        return self.get_hud_status().line_at_end
 
     def is_clip_open(self) -> bool:
-        return not all(
-            c > MIN_GRAY_SCALE_LEVEL for c in pag.pixel(*self.clip_icon_coord)
-        )
+        return self.get_hud_status().clip_open
 
     # ------------------------------ Text detection ------------------------------ #
     def is_tackle_ready(self):
-        return self._get_image_box("ready", 0.6)
+        return self._get_image_box(*STATE_TEMPLATES["tackle_ready"])
 
     def is_tackle_broken(self):
-        return self._get_image_box("broke", 0.8)
+        return self._get_image_box(*STATE_TEMPLATES["tackle_broken"])
 
     def is_lure_broken(self):
-        return self._get_image_box("lure_is_broken", 0.8)
+        return self._get_image_box(*STATE_TEMPLATES["lure_broken"])
 
     def is_moving_in_bottom_layer(self):
-        return self._get_image_box("movement", 0.7)
+        return self._get_image_box(*STATE_TEMPLATES["moving_in_bottom_layer"])
 
     # ------------------------------ Hint detection ------------------------------ #
     def is_disconnected(self):
@@ -330,30 +773,77 @@ class Detection:
     def get_food_position(self, food: str):
         return self._get_image_box(food, 0.9)
 
-    def is_energy_high(self) -> bool:
-        box = self._get_image_box("energy", 0.8)
+    def _get_stat_anchor(self, stat: str) -> tuple[int, int] | None:
+        """Get the center of a stat icon.
+
+        The position is cached per window geometry, but the icon is matched again
+        in a small crop around it on each call, so a hidden or moved HUD is noticed.
+
+        :param stat: Name of the stat icon.
+        :type stat: str
+        :return: Center of the icon, None if not found.
+        :rtype: tuple[int, int] | None
+        """
+        window_box = self.window.get_box()
+        if window_box != self._stat_anchor_window_box:
+            self._stat_anchors = {}
+            self._stat_anchor_window_box = window_box
+
+        if stat in self._stat_anchors:
+            x, y = self._stat_anchors[stat]
+            template = self.templates.get(stat)
+            height, width = template.shape[:2]
+            left = x - width // 2 - STAT_ICON_MARGIN
+            top = y - height // 2 - STAT_ICON_MARGIN
+            frame = self._grab(
+                (left, top, width + 2 * STAT_ICON_MARGIN, height + 2 * STAT_ICON_MARGIN)
+            )
+            if locate(template, frame.gray, confidence=0.8) is not None:
+                return x, y
+            del self._stat_anchors[stat]
+
+        box = self._get_image_box(stat, 0.8)
         if not box:
-            return False
-        x, y = utils.get_box_center_integers(box)
+            return None
+        self._stat_anchors[stat] = utils.get_box_center_integers(box)
+        return self._stat_anchors[stat]
+
+    def _is_stat_bar_filled(self, stat: str, threshold: float) -> bool | None:
+        """Check if a stat bar is filled up to a threshold.
+
+        The pixel at the threshold is compared with the one at the start of the bar,
+        both are read from a single row of pixels.
+
+        :param stat: Name of the stat icon ("energy", "food" or "comfort").
+        :type stat: str
+        :param threshold: Fraction of the bar to check.
+        :type threshold: float
+        :return: Whether both pixels match, None if the icon is not found.
+        :rtype: bool | None
+        """
+        anchor = self._get_stat_anchor(stat)
+        if anchor is None:
+            return None
+        x, y = anchor
+        start = x + round(STAT_BAR_STARTS[stat] * self.templates.scale)
+        length = max(round(STAT_BAR_LENGTH * threshold * self.templates.scale), 1)
+        row = self._grab((start, y, length, 1)).bgra[0, :, :3]
+        return bool((row[0] == row[-1]).all())
+
+    def is_energy_high(self) -> bool:
         # default threshold: 0.74,  well done FishSoft
-        last_point = int(19 + 152 * self.cfg.STAT.ENERGY_THRESHOLD) - 1
-        return pag.pixel(x + 19, y) == pag.pixel(x + last_point, y)
+        return (
+            self._is_stat_bar_filled("energy", self.cfg.STAT.ENERGY_THRESHOLD) is True
+        )
 
     def is_hunger_low(self) -> bool:
-        box = self._get_image_box("food", 0.8)
-        if not box:
-            return False
-        x, y = utils.get_box_center_integers(box)
-        last_point = int(18 + 152 * self.cfg.STAT.HUNGER_THRESHOLD) - 1
-        return not pag.pixel(x + 18, y) == pag.pixel(x + last_point, y)
+        return self._is_stat_bar_filled("food", self.cfg.STAT.HUNGER_THRESHOLD) is False
 
     def is_comfort_low(self) -> bool:
-        box = self._get_image_box("comfort", 0.8)
-        if not box:
-            return False
-        x, y = utils.get_box_center_integers(box)
-        last_point = int(18 + 152 * self.cfg.STAT.COMFORT_THRESHOLD) - 1
-        return not pag.pixel(x + 18, y) == pag.pixel(x + last_point, y)
+        return (
+            self._is_stat_bar_filled("comfort", self.cfg.STAT.COMFORT_THRESHOLD)
+            is False
+        )
 
     # ----------------------------- Item replacement ----------------------------- #
     def get_scrollbar_position(self):
@@ -369,18 +859,18 @@ class Detection:
         return self._get_image_box("pva_icon", 0.6) is None
 
     def is_dry_mix_chosen(self):
-        return not self._get_image_box("groundbait_is_not_chosen", 0.8)
+        return not self._get_image_box(*STATE_TEMPLATES["dry_mix_missing"])
 
     def is_bait_chosen(self):
-        if self.cfg.PROFILE.MODE in ("spin", "pirk", "elevator"):
+        if self.cfg.PROFILE.MODE in LURE_MODES:
             return True
 
         # Two bait slots, check only the first one
         if self.cfg.PROFILE.MODE in ("telescopic", "bolognese"):
             return (
-                pag.locate(
-                    pag.screenshot(region=self.bait_icon_coord),
-                    self.bait_icon_reference_img,
+                locate(
+                    self._grab(self.bait_icon_coord).gray,
+                    self.templates.get("bait_icon"),
                     confidence=0.6,
                 )
                 is None
@@ -401,20 +891,22 @@ class Detection:
 
     # ------------------------------ Friction brake ------------------------------ #
     def is_friction_brake_high(self) -> bool:
-        return pag.pixelMatchesColor(
-            *self.friction_brake_coord, RED_FRICTION_BRAKE, COLOR_TOLERANCE
-        )
+        return self.get_hud_status().friction_brake_high
 
     def is_reel_burning(self) -> bool:
-        return pag.pixel(*self.reel_burning_icon_coord) == ORANGE_REEL
-
-    def is_float_state_changed(self, reference_img):
-        current_img = pag.screenshot(region=self.float_camera_rect)
-        return not pag.locate(
-            current_img.filter(ImageFilter.GaussianBlur(radius=3)),
-            reference_img,
-            grayscale=True,
-            confidence=self.cfg.PROFILE.FLOAT_SENSITIVITY,
+        return self.get_hud_status().reel_burning
+
+    def get_float_monitor(self) -> FloatMonitor:
+        """Start monitoring the float camera with the current view as background.
+
+        Only the float camera is captured, so it's cheap enough to check often.
+
+        :return: Float state change detector.
+        :rtype: FloatMonitor
+        """
+        return FloatMonitor(
+            lambda: self._grab(self.float_camera_rect).gray,
+            self.cfg.PROFILE.FLOAT_SENSITIVITY,
         )
 
     def get_ticket_position(self, duration: int):
@@ -0,0 +1,143 @@
+"""In-memory ring buffer of recent frames for debugging failures."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from rf4s.controller.capture import CaptureBackend
+from rf4s.controller.logger import logger
+
+MAX_DUMPS = 5  # Per session, a dump takes a while and tens of MB on disk
+
+
+class FlightRecorder:
+    """Thread that keeps the most recent low-resolution frames of the game window.
+
+    The storage is allocated once according to the memory budget and overwritten in
+    a circle, so the memory usage doesn't grow with the session. Nothing is written
+    to disk until dump() is called, e.g., when a failure occurs.
+
+    Attributes:
+        capture (CaptureBackend): Capture backend to grab the frames.
+        region (tuple): Absolute region of the game window.
+        interval (float): Time between two frames.
+        size (tuple[int, int]): Width and height of the stored frames.
+        capacity (int): Maximum number of stored frames.
+    """
+
+    def __init__(
+        self,
+        capture: CaptureBackend,
+        region: tuple,
+        rate: float,
+        memory: int,
+        max_dimension: int,
+    ):
+        """Allocate the storage, call start() to run it.
+
+        :param capture: Capture backend to grab the frames.
+        :type capture: CaptureBackend
+        :param region: Absolute region (left, top, width, height) of the game window.
+        :type region: tuple
+        :param rate: Number of frames per second.
+        :type rate: float
+        :param memory: Memory budget in MB.
+        :type memory: int
+        :param max_dimension: Maximum length of the longer side of a stored frame,
+            0 to keep the original size.
+        :type max_dimension: int
+        """
+        self.capture = capture
+        self.region = region
+        self.interval = 1 / rate
+        _, _, width, height = region
+        scale = max_dimension / max(width, height)
+        if not 0 < scale < 1:
+            scale = 1
+        self.size = (round(width * scale), round(height * scale))
+        frame_size = self.size[0] * self.size[1] * 3
+        self.capacity = max(memory * 1024 * 1024 // frame_size, 1)
+
+        self._frames = np.empty(
+            (self.capacity, self.size[1], self.size[0], 3), dtype=np.uint8
+        )
+        self._timestamps = np.zeros(self.capacity)
+        self._count = 0  # Number of recorded frames, including the overwritten ones
+        self._dump_count = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        logger.info(
+            "Starting flight recorder (%ss of history)",
+            int(self.capacity * self.interval),
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Record frames at a fixed rate until stopped."""
+        while not self._stopped.is_set():
+            try:
+                self._record()
+            except Exception:
+                logger.exception("Failed to record frame")
+            self._stopped.wait(self.interval)
+
+    def _record(self) -> None:
+        """Grab a frame and downscale it into the oldest slot."""
+        frame = self.capture.grab(self.region)
+        timestamp = time.time()
+        with self._lock:
+            slot = self._count % self.capacity
+            cv2.resize(
+                frame.bgr,
+                self.size,
+                dst=self._frames[slot],
+                interpolation=cv2.INTER_AREA,
+            )
+            self._timestamps[slot] = timestamp
+            self._count += 1
+
+    def dump(self, output_dir: Path, reason: str) -> None:
+        """Save the recorded frames from the oldest to the newest.
+
+        The frames are saved as numbered PNGs, so the directory can be replayed with
+        ReplayCapture, along with their timestamps in flight_recorder.json.
+
+        :param output_dir: Directory to create and save the frames in.
+        :type output_dir: Path
+        :param reason: Why the frames are dumped, e.g., the name of the error.
+        :type reason: str
+        """
+        if self._dump_count >= MAX_DUMPS:
+            logger.warning(
+                "Flight recorder dump limit reached, %s is not dumped", reason
+            )
+            return
+        self._dump_count += 1
+        with self._lock:
+            count = min(self._count, self.capacity)
+            order = (np.arange(count) + self._count - count) % self.capacity
+            frames = self._frames[order]  # Fancy indexing makes a copy
+            timestamps = self._timestamps[order]
+
+        logger.info("Dumping %s frames of flight recorder", count)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for idx, frame in enumerate(frames):
+            _, buffer = cv2.imencode(".png", frame)
+            (output_dir / f"{idx:04d}.png").write_bytes(buffer.tobytes())
+        with open(output_dir / "flight_recorder.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {"reason": reason, "timestamps": timestamps.tolist()}, f, indent=4
+            )
+        logger.info("Flight recorder has been saved under logs/")
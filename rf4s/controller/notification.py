@@ -1,23 +1,50 @@
 import json
+import queue
 import smtplib
+import threading
 from datetime import datetime, timezone
 from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from enum import Enum
 from pathlib import Path
-from urllib import parse, request
+from typing import Callable
 
 import requests
-from discord_webhook import DiscordEmbed, DiscordWebhook
 from rich import box
 from rich.console import Console
 from rich.table import Table
 from yacs.config import CfgNode as CN
 
+from rf4s import exceptions
 from rf4s.controller.logger import logger
+from rf4s.controller.outbox import SESSION_ID, Outbox
+from rf4s.controller.screenshot import ScreenshotPayload
+from rf4s.controller.transport import (
+    RETRY_STATUS_CODES,
+    HttpTransport,
+    SmtpTransport,
+    TokenBucket,
+)
+
+
+def batched(items: list, size: int) -> list[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def get_result_text(result: dict) -> str:
+    return "".join(f"{k}: {v}\n" for k, v in result.items())
+
 
 ICON_URL = "https://i.ibb.co/RpLYcdkm/icon.png"
+MAX_MEDIA_PER_MESSAGE = 10  # Limit of both Discord and Telegram
+TELEGRAM_API_URL = "https://api.telegram.org"
+TELEGRAM_MAX_DIMENSION = 2560  # Larger photos are downscaled by Telegram anyway
+# Token buckets (rate, capacity) below the documented limits of the services:
+# Discord webhooks allow 5 requests per 2 seconds and 30 per minute per channel,
+# Telegram bots are allowed about 1 message per second in a chat.
+DISCORD_RATE_LIMIT = (0.5, 5)
+TELEGRAM_RATE_LIMIT = (1, 3)
 
 # Name                             | Int value | Hex code
 # ---------------------------------|-----------|----------
@@ -30,26 +57,301 @@ ICON_URL = "https://i.ibb.co/RpLYcdkm/icon.png"
 # `BLACK`                          | 2303786   | `#23272A`
 
 
-def send_screenshot(cfg: CN, filepath: Path) -> None:
+def encode_args(method: str, args: tuple) -> list:
+    """Convert the arguments of a job to be stored in the outbox.
+
+    :param method: Name of the method of the channel.
+    :type method: str
+    :param args: Arguments the method is called with.
+    :type args: tuple
+    :return: JSON-serializable arguments, with screenshots as their paths.
+    :rtype: list
+    """
+    if method in ("send_screenshot", "collect"):
+        return [str(args[0].filepath)]
+    if method == "send_digest":
+        return [[str(payload.filepath) for payload in args[0]], *args[1:]]
+    return list(args)
+
+
+def decode_args(method: str, args: list, payloads: dict, settings: CN) -> list:
+    """Restore the arguments of a job read from the outbox.
+
+    :param method: Name of the method of the channel.
+    :type method: str
+    :param args: Arguments stored in the outbox, with screenshots as their paths.
+    :type args: list
+    :param payloads: Screenshots already restored, so the channels share them.
+    :type payloads: dict
+    :param settings: Screenshot settings (BOT.SCREENSHOT).
+    :type settings: CN
+    :return: Arguments to call the method with.
+    :rtype: list
+    """
+
+    def get_payload(filepath: str) -> ScreenshotPayload:
+        if filepath not in payloads:
+            payloads[filepath] = ScreenshotPayload(Path(filepath), settings)
+        return payloads[filepath]
+
+    if method in ("send_screenshot", "collect"):
+        return [get_payload(args[0])]
+    if method == "send_digest":
+        return [[get_payload(filepath) for filepath in args[0]], *args[1:]]
+    return args
+
+
+def get_image_part(payload: ScreenshotPayload) -> MIMEImage:
+    image = MIMEImage(payload.data, name=payload.name)
+    image.add_header("Content-Disposition", "attachment", filename=payload.name)
+    return image
+
+
+def get_notifications(cfg: CN, http: HttpTransport, smtp: SmtpTransport) -> list:
+    """Create the notification channels enabled by the launch options.
+
+    :param cfg: Configuration node.
+    :type cfg: CN
+    :param http: HTTP transport shared by the webhook channels.
+    :type http: HttpTransport
+    :param smtp: SMTP transport of the email channel.
+    :type smtp: SmtpTransport
+    :return: Enabled notification channels.
+    :rtype: list
+    """
+    notifications = []
     if cfg.ARGS.DISCORD:
-        DiscordNotification(cfg).send_screenshot(filepath)
+        notifications.append(DiscordNotification(cfg, http))
     if cfg.ARGS.EMAIL:
-        EmailNotification(cfg).send_screenshot(filepath)
+        notifications.append(EmailNotification(cfg, smtp))
     if cfg.ARGS.MIAOTIXING:
-        MiaotixingNotification(cfg).send_screenshot(filepath)
+        notifications.append(MiaotixingNotification(cfg, http))
     if cfg.ARGS.TELEGRAM:
-        TelegramNotification(cfg).send_screenshot(filepath)
+        notifications.append(TelegramNotification(cfg, http))
+    return notifications
+
+
+class NotificationDispatcher:
+    """Send notifications from a pool of worker threads.
+
+    Jobs are queued and the caller continues immediately, so a slow channel never
+    stalls the fishing loop. Each channel has its own timeout per request, and the
+    connections are kept alive between messages. The workers are daemon threads, so
+    a request that is still retrying when the bot quits doesn't delay the exit.
+
+    In digest mode, screenshots are collected until there are enough of them or the
+    first one has waited long enough, then each channel sends them together with a
+    summary of the running result, in as few messages as it allows. Each message is
+    a job of its own, so a failed one doesn't resend the others.
+
+    A screenshot is read and encoded once, then shared by all channels as an
+    immutable payload.
+
+    Every job is written to the outbox before it's queued, and removed once the
+    channel has acknowledged it. Jobs lost by a crash, a disconnection, or the flush
+    timeout are sent again the next time the dispatcher is created. Screenshots
+    collected for a digest are written as well, and removed once the digest jobs
+    that carry them are written.
+
+    Attributes:
+        http (HttpTransport): HTTP transport shared by the webhook channels.
+        smtp (SmtpTransport): SMTP transport of the email channel.
+        notifications (list): Enabled notification channels.
+        outbox (Outbox): Journal of the jobs that are not acknowledged yet.
+    """
+
+    def __init__(self, cfg: CN, get_summary: Callable[[], dict], outbox_path: Path):
+        """Create the channels and replay the jobs left in the outbox.
+
+        :param cfg: Configuration node.
+        :type cfg: CN
+        :param get_summary: Function to get the running result for digests.
+        :type get_summary: Callable[[], dict]
+        :param outbox_path: Path of the outbox file.
+        :type outbox_path: Path
+        """
+        self.get_summary = get_summary
+        self.screenshot_settings = cfg.BOT.SCREENSHOT
+        self.digest_size = cfg.BOT.NOTIFICATION.DIGEST_SIZE
+        self.digest_window = cfg.BOT.NOTIFICATION.DIGEST_WINDOW
+        self.http = HttpTransport(
+            cfg.BOT.NOTIFICATION.CONNECT_TIMEOUT,
+            cfg.BOT.NOTIFICATION.READ_TIMEOUT,
+            cfg.BOT.NOTIFICATION.MAX_RETRIES,
+        )
+        self.smtp = SmtpTransport(
+            cfg.BOT.NOTIFICATION.SMTP_SERVER,
+            cfg.BOT.NOTIFICATION.EMAIL,
+            cfg.BOT.NOTIFICATION.PASSWORD,
+            cfg.BOT.NOTIFICATION.READ_TIMEOUT,
+        )
+        self.notifications = get_notifications(cfg, self.http, self.smtp)
+        self.max_workers = cfg.BOT.NOTIFICATION.WORKERS
+        self._jobs = queue.Queue()
+        self._workers = []
+        self._pending = 0  # Queued and running jobs
+        self._closed = False
+        self._idle = threading.Condition()
+        self._digest = []
+        self._digest_timer = None
+        self._digest_lock = threading.Lock()
+        self.outbox = Outbox(outbox_path)
+        self._replay()
+
+    def _replay(self) -> None:
+        """Send the jobs left in the outbox by previous runs."""
+        channels = {type(n).__name__: n for n in self.notifications}
+        # Jobs of this run belong to the dispatcher before the bot was restarted
+        jobs = [job for job in self.outbox.compact() if job["session"] != SESSION_ID]
+        if not jobs:
+            return
+        logger.info("Resending %s notification(s) from outbox", len(jobs))
+        payloads = {}
+        for job in jobs:
+            args = decode_args(
+                job["method"], job["args"], payloads, self.screenshot_settings
+            )
+            if job["method"] == "collect":
+                if self.notifications:  # Otherwise kept until a channel is enabled
+                    self._collect(job["id"], *args)
+                continue
+            notification = channels.get(job["channel"])
+            if notification is None:  # Kept until the channel is enabled again
+                continue
+            self._queue(job["id"], getattr(notification, job["method"]), *args)
+
+    def send_screenshot(self, payload: ScreenshotPayload) -> None:
+        if self.digest_size <= 1:
+            for notification in self.notifications:
+                self._submit(notification, "send_screenshot", payload)
+            return
+        if self.notifications:
+            self._collect(self.outbox.add(None, "collect", [payload.filepath]), payload)
+
+    def _collect(self, job_id: str, payload: ScreenshotPayload) -> None:
+        """Add a screenshot to the digest, or send it alone if it's disabled.
+
+        :param job_id: Id of the screenshot in the outbox.
+        :type job_id: str
+        :param payload: Screenshot to send.
+        :type payload: ScreenshotPayload
+        """
+        if self.digest_size <= 1:  # Left by a run in digest mode
+            for notification in self.notifications:
+                self._submit(notification, "send_screenshot", payload)
+            self.outbox.remove(job_id)
+            return
+
+        with self._digest_lock:
+            self._digest.append((job_id, payload))
+            if len(self._digest) < self.digest_size:
+                if self._digest_timer is None:
+                    self._digest_timer = threading.Timer(
+                        self.digest_window, self.send_digest
+                    )
+                    self._digest_timer.daemon = True
+                    self._digest_timer.start()
+                return
+        self.send_digest()
+
+    def send_digest(self) -> None:
+        """Send the collected screenshots with a summary of the running result."""
+        with self._digest_lock:
+            collected, self._digest = self._digest, []
+            if self._digest_timer is not None:
+                self._digest_timer.cancel()
+                self._digest_timer = None
+        if not collected:
+            return
+        job_ids, payloads = zip(*collected)
+        summary = self.get_summary()
+        for notification in self.notifications:
+            # One job per message, so a failed one doesn't resend the others
+            size = notification.digest_batch_size or len(payloads)
+            for batch in batched(list(payloads), size):
+                self._submit(notification, "send_digest", batch, summary, len(payloads))
+        # The digest jobs carry the screenshots from now on, removing them only
+        # after all channels have acknowledged would resend the digest to the
+        # channels that did.
+        for job_id in job_ids:
+            self.outbox.remove(job_id)
 
+    def send_result(self, result: dict) -> None:
+        for notification in self.notifications:
+            self._submit(notification, "send_result", result)
 
-def send_result(cfg: CN, result: dict) -> None:
-    if cfg.ARGS.DISCORD:
-        DiscordNotification(cfg).send_result(result)
-    if cfg.ARGS.EMAIL:
-        EmailNotification(cfg).send_result(result)
-    if cfg.ARGS.MIAOTIXING:
-        MiaotixingNotification(cfg).send_result(result)
-    if cfg.ARGS.TELEGRAM:
-        TelegramNotification(cfg).send_result(result)
+    def _submit(self, notification, method: str, *args) -> None:
+        job_id = self.outbox.add(
+            type(notification).__name__, method, encode_args(method, args)
+        )
+        self._queue(job_id, getattr(notification, method), *args)
+
+    def _queue(self, job_id: str, func: Callable, *args) -> None:
+        with self._idle:
+            self._pending += 1
+            if len(self._workers) < min(self._pending, self.max_workers):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"notification-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        self._jobs.put((job_id, func, args))
+
+    def _work(self) -> None:
+        """Run the queued jobs until the dispatcher is flushed."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            job_id, func, args = job
+            if not self._closed:  # Otherwise it's left in the outbox
+                self._run(job_id, func, *args)
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+
+    def _run(self, job_id: str, func: Callable, *args) -> None:
+        """Send a notification, and acknowledge it unless it can be sent later."""
+        try:
+            func(*args)
+        except FileNotFoundError as e:
+            logger.error("Screenshot not found: %s", e.filename)
+        except (exceptions.NotificationError, requests.RequestException, OSError):
+            logger.exception("Failed to send notification, it's kept in outbox")
+            return
+        except Exception:
+            logger.exception("Failed to send notification")
+        self.outbox.remove(job_id)
+
+    def flush(self, timeout: float) -> None:
+        """Wait for the queued notifications, then leave the remaining ones in the
+        outbox.
+
+        The connections are closed and the outbox is cleaned up if all notifications
+        are sent.
+
+        :param timeout: Maximum time to wait.
+        :type timeout: float
+        """
+        self.send_digest()
+        with self._idle:
+            if self._pending:
+                logger.info("Sending %s pending notification(s)", self._pending)
+            done = self._idle.wait_for(lambda: self._pending == 0, timeout)
+            self._closed = True
+            pending = self._pending
+        for _ in self._workers:
+            self._jobs.put(None)
+        if not done:
+            # The daemon workers are killed on exit, and the jobs are sent again by
+            # the next run.
+            logger.warning("%s notification(s) timed out, kept in outbox", pending)
+            return
+        self.http.close()
+        self.smtp.close()
+        self.outbox.compact()
 
 
 class DiscordColor(Enum):
@@ -63,8 +365,12 @@ class DiscordColor(Enum):
 
 
 class DiscordNotification:
-    def __init__(self, cfg):
+    digest_batch_size = MAX_MEDIA_PER_MESSAGE
+
+    def __init__(self, cfg, http: HttpTransport):
         self.cfg = cfg
+        self.http = http
+        self.bucket = TokenBucket(*DISCORD_RATE_LIMIT)
 
     def _get_raw_result_table(self, result: dict) -> str:
         console = Console(width=100, force_terminal=True, color_system=None)
@@ -77,52 +383,71 @@ class DiscordNotification:
             console.print(table)
         return capture.get().strip()
 
-    def _get_webhook(self) -> DiscordWebhook:
-        return DiscordWebhook(
-            url=self.cfg.BOT.NOTIFICATION.DISCORD_WEBHOOK_URL,
-            username="RF4S",
-            avatar_url=ICON_URL,
-        )
+    def _get_payload(self, embed: dict) -> dict:
+        return {"username": "RF4S", "avatar_url": ICON_URL, "embeds": [embed]}
 
-    def _get_embed(self, title: str) -> DiscordEmbed:
-        return DiscordEmbed(
-            title=title,
-            color=DiscordColor.BLURPLE.value,  # TODO: dynamic color
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            footer={"text": "RF4S: Russian Fishing 4 Script", "icon_url": ICON_URL},
-        )
+    def _get_embed(self, title: str) -> dict:
+        return {
+            "title": title,
+            "color": DiscordColor.BLURPLE.value,  # TODO: dynamic color
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "footer": {"text": "RF4S: Russian Fishing 4 Script", "icon_url": ICON_URL},
+        }
 
-    def _send_webhook(self, webhook: DiscordWebhook) -> None:
-        response = webhook.execute()
-        if response.status_code == 200:
+    def _send_webhook(self, payload: dict, files: dict | None = None) -> None:
+        url = self.cfg.BOT.NOTIFICATION.DISCORD_WEBHOOK_URL
+        if files:
+            # Embeds must be sent as a form field along with the files
+            response = self.http.request(
+                "POST",
+                url,
+                self.bucket,
+                data={"payload_json": json.dumps(payload)},
+                files=files,
+            )
+        else:
+            response = self.http.request("POST", url, self.bucket, json=payload)
+        if response.status_code in (200, 204):  # 204 if ?wait=true is not set
             logger.info("Message sent successfully")
+        elif response.status_code in RETRY_STATUS_CODES:
+            raise exceptions.NotificationError(response.text)
         else:
             logger.error(f"Failed to send the message: {response.text}")
 
     def send_result(self, result: dict):
         logger.info("Sending running result to Discord")
-        webhook = self._get_webhook()
         embed = self._get_embed("Running Result")
 
         # Wrap it with a code block
-        embed.description = f"```\n{self._get_raw_result_table(result)}\n```"
-        webhook.add_embed(embed)
-        self._send_webhook(webhook)
+        embed["description"] = f"```\n{self._get_raw_result_table(result)}\n```"
+        self._send_webhook(self._get_payload(embed))
 
-    def send_screenshot(self, filepath: Path):
+    def send_screenshot(self, payload: ScreenshotPayload):
         logger.info("Sending catch notification to Discord")
-        webhook = self._get_webhook()
         embed = self._get_embed("Catch Notification")
-        with open(filepath, "rb") as f:
-            webhook.add_file(file=f.read(), filename=filepath.name)
-        embed.set_image(url=f"attachment://{filepath.name}")
-        webhook.add_embed(embed)
-        self._send_webhook(webhook)
+        embed["image"] = {"url": f"attachment://{payload.name}"}
+        files = {"files[0]": (payload.name, payload.data)}
+        self._send_webhook(self._get_payload(embed), files)
+
+    def send_digest(
+        self, payloads: list[ScreenshotPayload], summary: dict, total: int
+    ) -> None:
+        logger.info("Sending catch digest to Discord")
+        embed = self._get_embed(f"Catch Digest ({total})")
+        embed["description"] = f"```\n{self._get_raw_result_table(summary)}\n```"
+        files = {
+            f"files[{i}]": (payload.name, payload.data)
+            for i, payload in enumerate(payloads)
+        }
+        self._send_webhook(self._get_payload(embed), files)
 
 
 class EmailNotification:
-    def __init__(self, cfg):
+    digest_batch_size = None  # All screenshots in one email
+
+    def __init__(self, cfg, smtp: SmtpTransport):
         self.cfg = cfg
+        self.smtp = smtp
 
     def _get_msg(self, subject: str) -> MIMEMultipart:
         msg = MIMEMultipart()
@@ -134,45 +459,52 @@ class EmailNotification:
 
     def _send_email(self, msg: MIMEMultipart) -> None:
         try:
-            with smtplib.SMTP_SSL(self.cfg.BOT.NOTIFICATION.SMTP_SERVER, 465) as server:
-                # smtp_server.ehlo()
-                server.login(
-                    self.cfg.BOT.NOTIFICATION.EMAIL, self.cfg.BOT.NOTIFICATION.PASSWORD
-                )
-                server.sendmail(
-                    self.cfg.BOT.NOTIFICATION.EMAIL,
-                    [self.cfg.BOT.NOTIFICATION.EMAIL],
-                    msg.as_string(),
-                )
+            self.smtp.send([self.cfg.BOT.NOTIFICATION.EMAIL], msg.as_string())
             logger.info("Message sent successfully")
-        except Exception as e:
+        except smtplib.SMTPRecipientsRefused as e:
+            # Temporary only if a recipient got a 4xx reply
+            if any(code < 500 for code, _ in e.recipients.values()):
+                raise
+            logger.error(f"Failed to send the message: {e}")
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code < 500:  # Temporary failure
+                raise
+            logger.error(f"Failed to send the message: {e}")
+        except smtplib.SMTPNotSupportedError as e:  # The server will never accept it
             logger.error(f"Failed to send the message: {e}")
 
     def send_result(self, result: dict) -> None:
         """Send a notification email to the user's email address."""
         logger.info("Sending running result to email")
         msg = self._get_msg("RF4S: Running Result")
-        text = ""
-        for k, v in result.items():
-            text += f"{k}: {v}\n"
-        msg.attach(MIMEText(text))
+        msg.attach(MIMEText(get_result_text(result)))
         self._send_email(msg)
 
-    def send_screenshot(self, filepath: Path) -> None:
+    def send_screenshot(self, payload: ScreenshotPayload) -> None:
         """Send a notification email to the user's email address."""
         logger.info("Sending email notification")
         msg = self._get_msg("RF4S: Catch Notification")
+        # The base64-encoded part is created once per screenshot
+        msg.attach(payload.get_variant("email", get_image_part))
+        self._send_email(msg)
 
-        with open(filepath, "rb") as f:
-            img = MIMEImage(f.read(), name=filepath.name)
-        img.add_header("Content-Disposition", "attachment", filename=filepath.name)
-        msg.attach(img)
+    def send_digest(
+        self, payloads: list[ScreenshotPayload], summary: dict, total: int
+    ) -> None:
+        logger.info("Sending catch digest to email")
+        msg = self._get_msg(f"RF4S: Catch Digest ({total})")
+        msg.attach(MIMEText(get_result_text(summary)))
+        for payload in payloads:
+            msg.attach(payload.get_variant("email", get_image_part))
         self._send_email(msg)
 
 
 class MiaotixingNotification:
-    def __init__(self, cfg):
+    digest_batch_size = None
+
+    def __init__(self, cfg, http: HttpTransport):
         self.cfg = cfg
+        self.http = http
 
     def send_result(self, result: dict) -> None:
         """Send a notification to the user's miaotixing service.
@@ -182,71 +514,115 @@ class MiaotixingNotification:
         """
         logger.info("Sending running result to Miaotixing")
 
-        text = ""
-        for k, v in result.items():
-            text += f"{k}: {v}\n"
+        text = get_result_text(result)
 
-        url = "http://miaotixing.com/trigger?" + parse.urlencode(
-            {"id": self.cfg.BOT.NOTIFICATION.MIAO_CODE, "text": text, "type": "json"}
+        response = self.http.request(
+            "GET",
+            "http://miaotixing.com/trigger",
+            params={
+                "id": self.cfg.BOT.NOTIFICATION.MIAO_CODE,
+                "text": text,
+                "type": "json",
+            },
         )
+        if response.status_code in RETRY_STATUS_CODES:
+            raise exceptions.NotificationError(response.text)
+        json_object = response.json()
+        if json_object["code"] == 0:
+            logger.info("Miaotixing notification sent successfully")
+        else:
+            logger.error(
+                "Miaotixing notification with error code: %s\nDescription: %s",
+                str(json_object["code"]),
+                json_object["msg"],
+            )
 
-        with request.urlopen(url) as page:
-            result = page.read()
-            json_object = json.loads(result)
-            if json_object["code"] == 0:
-                logger.info("Miaotixing notification sent successfully")
-            else:
-                logger.error(
-                    "Miaotixing notification with error code: %s\nDescription: %s",
-                    str(json_object["code"]),
-                    json_object["msg"],
-                )
-
-    def send_screenshot(self, _: Path) -> None:
+    def send_screenshot(self, _: ScreenshotPayload) -> None:
         logger.error("Miaotixing doesn't support image message")
 
+    def send_digest(self, _: list[ScreenshotPayload], summary: dict, __: int) -> None:
+        self.send_result(summary)  # Image messages are not supported
+
 
 class TelegramNotification:
-    def __init__(self, cfg):
+    digest_batch_size = MAX_MEDIA_PER_MESSAGE
+
+    def __init__(self, cfg, http: HttpTransport):
         self.cfg = cfg
+        self.http = http
+        self.bucket = TokenBucket(*TELEGRAM_RATE_LIMIT)
+
+    def _get_url(self, method: str) -> str:
+        return (
+            f"{TELEGRAM_API_URL}/"
+            f"bot{self.cfg.BOT.NOTIFICATION.TELEGRAM_BOT_TOKEN}/{method}"
+        )
 
     def _check_response_status(self, response: requests.Response) -> None:
         if response.status_code == 200:
             logger.info("Message sent successfully")
+        elif response.status_code in RETRY_STATUS_CODES:
+            raise exceptions.NotificationError(response.text)
         else:
             logger.error(f"Failed to send the message: {response.text}")
 
     def send_result(self, result: dict) -> None:
         logger.info("Sending running result to Telegram")
         # Send a simple message, no need for fancy python-telegram-bot
-        text = "*Running Result*\n```\n"
-        for k, v in result.items():
-            text += f"{k}: {v}\n"
-        text += "```"
+        text = f"*Running Result*\n```\n{get_result_text(result)}```"
         payload = {
             "chat_id": self.cfg.BOT.NOTIFICATION.TELEGRAM_CHAT_ID,
             "text": text,
             "parse_mode": "MarkdownV2",
         }
-        response = requests.post(
-            "https://api.telegram.org/"
-            f"bot{self.cfg.BOT.NOTIFICATION.TELEGRAM_BOT_TOKEN}/sendMessage",
-            json=payload,
+        response = self.http.request(
+            "POST", self._get_url("sendMessage"), self.bucket, json=payload
         )
         self._check_response_status(response)
 
-    def send_screenshot(self, filepath: Path) -> None:
+    def _get_photo(self, payload: ScreenshotPayload) -> tuple[str, bytes]:
+        return payload.name, payload.resize(TELEGRAM_MAX_DIMENSION)
+
+    def send_screenshot(self, payload: ScreenshotPayload) -> None:
         logger.info("Sending catch notification to Telegram")
-        with open(filepath, "rb") as img:
-            files = {"photo": img}
-            payload = {
+        files = {"photo": self._get_photo(payload)}
+        form = {
+            "chat_id": self.cfg.BOT.NOTIFICATION.TELEGRAM_CHAT_ID,
+            "parse_mode": "MarkdownV2",
+        }
+        response = self.http.request(
+            "POST", self._get_url("sendPhoto"), self.bucket, data=form, files=files
+        )
+        self._check_response_status(response)
+
+    def send_digest(
+        self, payloads: list[ScreenshotPayload], summary: dict, total: int
+    ) -> None:
+        logger.info("Sending catch digest to Telegram")
+        caption = f"Catch Digest ({total})\n{get_result_text(summary)}"
+        if len(payloads) == 1:  # A media group needs at least 2 items
+            files = {"photo": self._get_photo(payloads[0])}
+            form = {
                 "chat_id": self.cfg.BOT.NOTIFICATION.TELEGRAM_CHAT_ID,
-                "parse_mode": "MarkdownV2",
+                "caption": caption,
             }
-            response = requests.post(
-                "https://api.telegram.org/"
-                f"bot{self.cfg.BOT.NOTIFICATION.TELEGRAM_BOT_TOKEN}/sendPhoto",
-                data=payload,
-                files=files,
+            response = self.http.request(
+                "POST", self._get_url("sendPhoto"), self.bucket, data=form, files=files
             )
+            self._check_response_status(response)
+            return
+
+        media = []
+        files = {}
+        for i, payload in enumerate(payloads):
+            media.append({"type": "photo", "media": f"attach://photo{i}"})
+            files[f"photo{i}"] = self._get_photo(payload)
+        media[0]["caption"] = caption  # Shown as the caption of the album
+        form = {
+            "chat_id": self.cfg.BOT.NOTIFICATION.TELEGRAM_CHAT_ID,
+            "media": json.dumps(media),
+        }
+        response = self.http.request(
+            "POST", self._get_url("sendMediaGroup"), self.bucket, data=form, files=files
+        )
         self._check_response_status(response)
@@ -0,0 +1,106 @@
+"""Persistent outbox of notification jobs."""
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+
+# Identify the jobs of this process, so only the ones left by previous runs are
+# replayed when the bot restarts after a pause.
+SESSION_ID = uuid.uuid4().hex
+
+# Shared by all outboxes because the dispatchers of a paused and a restarted bot
+# may write to the same file at the same time.
+_lock = threading.Lock()
+
+
+class Outbox:
+    """Append-only journal of notification jobs.
+
+    A job is appended before it's dispatched, and a tombstone with the same id is
+    appended once the channel acknowledges it. Jobs without a tombstone are left
+    over from a crash or an exit before they were delivered.
+
+    Attributes:
+        path (Path): Path of the journal file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _append(self, record: dict) -> None:
+        with _lock, open(self.path, "a", encoding="utf-8") as f:
+            # Paths are stored as strings
+            f.write(json.dumps(record, default=str) + "\n")
+
+    def add(self, channel: str | None, method: str, args: list) -> str:
+        """Record a job before dispatching it.
+
+        :param channel: Name of the notification channel, None if the job is not
+            bound to a channel yet.
+        :type channel: str | None
+        :param method: Name of the method of the channel.
+        :type method: str
+        :param args: JSON-serializable arguments of the method.
+        :type args: list
+        :return: Id of the job.
+        :rtype: str
+        """
+        job_id = uuid.uuid4().hex
+        self._append(
+            {
+                "id": job_id,
+                "session": SESSION_ID,
+                "channel": channel,
+                "method": method,
+                "args": args,
+            }
+        )
+        return job_id
+
+    def remove(self, job_id: str) -> None:
+        """Mark a job as acknowledged.
+
+        :param job_id: Id of the job.
+        :type job_id: str
+        """
+        self._append({"id": job_id, "done": True})
+
+    def _load(self) -> list[dict]:
+        """Read the jobs that are not acknowledged, in the order they were added.
+
+        :return: Pending jobs.
+        :rtype: list[dict]
+        """
+        if not self.path.exists():
+            return []
+        jobs = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:  # Cut off by a crash
+                    continue
+                if record.get("done"):
+                    jobs.pop(record["id"], None)
+                else:
+                    jobs[record["id"]] = record
+        return list(jobs.values())
+
+    def compact(self) -> list[dict]:
+        """Rewrite the journal with only the pending jobs, or delete it if empty.
+
+        :return: Pending jobs.
+        :rtype: list[dict]
+        """
+        with _lock:
+            jobs = self._load()
+            if not jobs:
+                self.path.unlink(missing_ok=True)
+                return []
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(job) + "\n" for job in jobs)
+            os.replace(tmp_path, self.path)
+        return jobs
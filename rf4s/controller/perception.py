@@ -0,0 +1,156 @@
+"""Background perception of the game state."""
+
+import copy
+import threading
+import time
+from typing import Iterable
+
+from rf4s.controller.detection import Detection, GameState
+from rf4s.controller.logger import logger
+
+IDLE_INTERVALS = 5  # Stop perceiving after this many intervals without a request
+
+
+class PerceptionWorker:
+    """Thread that keeps perceiving the game state and publishes the latest one.
+
+    The action loop tells the worker which flags it needs, then reads the latest
+    snapshot or blocks until a flag changes instead of sleeping blindly. A request
+    wakes the worker up, and only a snapshot captured after the request is returned,
+    so it always reflects the previous key or mouse action of the caller. When
+    nobody reads the state for a few intervals, the worker idles until the next
+    request.
+
+    Attributes:
+        detection (Detection): Detection instance owned by the worker thread.
+        interval (float): Time between perceptions.
+    """
+
+    def __init__(self, detection: Detection, rate: float):
+        """Set up the worker, call start() to run it.
+
+        :param detection: Detection instance to copy for the worker thread.
+        :type detection: Detection
+        :param rate: Number of perceptions per second.
+        :type rate: float
+        """
+        # Use a copy so the frames of both threads don't interfere with each other,
+        # templates and coordinates are read-only and can be shared.
+        self.detection = copy.copy(detection)
+        self.interval = 1 / rate
+        self._flags = frozenset()
+        self._state = None
+        self._captured_at = 0.0
+        self._change_count = 0
+        self._last_request = 0.0
+        self._waiters = 0  # Number of callers blocked in wait_for_change()
+        self._condition = threading.Condition()
+        self._requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        logger.info("Starting perception thread")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._requested.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Perceive the requested flags at a fixed rate and publish the results."""
+        while not self._stopped.is_set():
+            self._requested.clear()
+            flags = self._flags
+            if not flags or self._is_idle():
+                self._requested.wait()
+                continue
+            captured_at = time.monotonic()
+            try:
+                state = self.detection.get_game_state(flags)
+            except Exception:
+                logger.exception("Failed to perceive game state")
+            else:
+                self._publish(flags, state, captured_at)
+            self._requested.wait(self.interval)
+
+    def _is_idle(self) -> bool:
+        """Check if nobody has read the state for a while.
+
+        :return: True if the worker should wait for the next request.
+        :rtype: bool
+        """
+        with self._condition:
+            return (
+                not self._waiters
+                and time.monotonic() - self._last_request
+                > IDLE_INTERVALS * self.interval
+            )
+
+    def _publish(self, flags: frozenset, state: GameState, captured_at: float) -> None:
+        """Replace the latest state and wake up the waiters if a flag changed.
+
+        :param flags: Flags perceived in the state.
+        :type flags: frozenset
+        :param state: Newly perceived state.
+        :type state: GameState
+        :param captured_at: Monotonic time before the frame was captured.
+        :type captured_at: float
+        """
+        with self._condition:
+            if flags != self._flags:  # Outdated, the requested flags are changed
+                return
+            if self._state is None or any(
+                getattr(state, flag) != getattr(self._state, flag) for flag in flags
+            ):
+                self._change_count += 1
+            self._state = state
+            self._captured_at = captured_at
+            self._condition.notify_all()
+
+    def get_state(self, flags: Iterable[str], timeout: float) -> GameState | None:
+        """Get a state captured after this call, waking up the worker for it.
+
+        :param flags: Flags needed by the caller.
+        :type flags: Iterable[str]
+        :param timeout: Maximum time to wait for a state.
+        :type timeout: float
+        :return: Latest state, None if timed out.
+        :rtype: GameState | None
+        """
+        flags = frozenset(flags)
+        requested_at = time.monotonic()
+        with self._condition:
+            if flags != self._flags:
+                self._flags = flags
+                self._state = None
+            self._last_request = requested_at
+            self._requested.set()
+            if self._condition.wait_for(
+                lambda: self._state is not None and self._captured_at >= requested_at,
+                timeout,
+            ):
+                return self._state
+            return None
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Block until a perceived flag changes.
+
+        :param timeout: Maximum time to wait.
+        :type timeout: float
+        :return: True if a flag changed, False if timed out.
+        :rtype: bool
+        """
+        with self._condition:
+            change_count = self._change_count
+            self._waiters += 1
+            self._requested.set()  # Wake up an idle worker
+            try:
+                return self._condition.wait_for(
+                    lambda: self._change_count != change_count, timeout
+                )
+            finally:
+                self._waiters -= 1
+                self._last_request = time.monotonic()
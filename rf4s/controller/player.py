@@ -21,7 +21,11 @@ from rf4s.component.friction_brake import FrictionBrake
 from rf4s.component.tackle import Tackle
 from rf4s.controller.logger import logger
 from rf4s.controller.detection import Detection, TagColor
-from rf4s.controller.notification import send_result, send_screenshot
+from rf4s.controller.flight_recorder import FlightRecorder
+from rf4s.controller.notification import NotificationDispatcher
+from rf4s.controller.perception import PerceptionWorker
+from rf4s.controller.screenshot import ScreenshotWriter
+from rf4s.controller.session import SESSION_SUFFIX, SessionRecorder
 from rf4s.controller.timer import Timer
 from rf4s.result.result import BotResult
 from rf4s.utils import add_jitter, press
@@ -39,6 +43,16 @@ DROP_ROD_DELAY = 4
 TICKET_EXPIRE_DELAY = 8
 DISCONNECTED_DELAY = 8
 
+# Unexpected failures that dump the flight recorder, not the routine ones like a
+# snagged line or a broken lure that are handled and fished on
+FLIGHT_RECORDER_ERRORS = (
+    exceptions.LineAtEndError,
+    exceptions.TackleBrokenError,
+    exceptions.DisconnectedError,
+    exceptions.StuckAtCastingError,
+    exceptions.LiftTimeoutError,
+)
+
 TROLLING_KEY = "j"
 LEFT_KEY = "a"
 RIGHT_KEY = "d"
@@ -91,6 +105,14 @@ class Player:
         self.have_new_dry_mix = True
         self.have_new_pva = True
         self.friction_brake = None
+        self.perception = None
+        self.screenshot_writer = None
+        self.flight_recorder = None
+        self.session_recorder = None
+        self.dispatcher = NotificationDispatcher(
+            cfg, self.get_summary_dict, OUTER_ROOT / "logs" / "outbox.jsonl"
+        )
+        self.dumped_error = None
 
         self.trolling_started = False
         self.mouse_pressed = False
@@ -114,8 +136,53 @@ class Player:
             press("esc")
             sleep(ANIMATION_DELAY)
 
+        if self.cfg.BOT.PERCEPTION_RATE > 0:
+            # Define here because it must be stopped when the bot is paused
+            self.perception = PerceptionWorker(
+                self.detection, self.cfg.BOT.PERCEPTION_RATE
+            )
+            for tackle in self.tackles:
+                tackle.perception = self.perception
+            self.perception.start()
+
+        self.screenshot_writer = ScreenshotWriter(self.cfg)
+        self.screenshot_writer.start()
+
+        if self.cfg.BOT.FLIGHT_RECORDER.RATE > 0:
+            self.flight_recorder = FlightRecorder(
+                self.detection.capture,
+                self.detection.window.get_box(),
+                self.cfg.BOT.FLIGHT_RECORDER.RATE,
+                self.cfg.BOT.FLIGHT_RECORDER.MEMORY,
+                self.cfg.BOT.FLIGHT_RECORDER.MAX_DIMENSION,
+            )
+            self.flight_recorder.start()
+
+        if self.cfg.BOT.SESSION_RECORDER.RATE > 0:
+            self.session_recorder = SessionRecorder(
+                self.detection,
+                self.timer.get_new_dir_path().with_suffix(SESSION_SUFFIX),
+                self.cfg.BOT.SESSION_RECORDER.RATE,
+                self.cfg.BOT.SESSION_RECORDER.COMPRESSION_LEVEL,
+                self.cfg.BOT.SESSION_RECORDER.MAX_DIMENSION,
+                self.get_stage_name,
+            )
+            self.session_recorder.start()
+
         logger.info("Starting fishing mode: '%s'", self.cfg.PROFILE.MODE)
-        getattr(self, f"start_{self.cfg.PROFILE.MODE}_mode")()
+        try:
+            getattr(self, f"start_{self.cfg.PROFILE.MODE}_mode")()
+        finally:
+            if self.perception is not None:
+                self.perception.stop()
+            if self.flight_recorder is not None:
+                self.flight_recorder.stop()
+            if self.session_recorder is not None:
+                self.session_recorder.stop()
+            self.screenshot_writer.stop()
+
+    def get_stage_name(self) -> str | None:
+        return None if self.tackle.stage is None else self.tackle.stage.name
 
     def hold_down_left_mouse_button(self):
         pag.mouseDown()
@@ -168,9 +235,29 @@ class Player:
             self.hold_down_shift_key()
 
     @contextmanager
-    def loop_restart_handler(self):
+    def flight_recorder_handler(self):
+        """Dump the flight recorder when a failure passes through."""
         try:
             yield
+        except FLIGHT_RECORDER_ERRORS as e:
+            # Nested handlers see the same error, dump it only once
+            if self.flight_recorder is not None and e is not self.dumped_error:
+                self.dumped_error = e
+                reason = type(e).__name__
+                output_dir = self.timer.get_new_dir_path()
+                try:
+                    self.flight_recorder.dump(
+                        output_dir.with_name(f"{output_dir.name}--{reason}"), reason
+                    )
+                except Exception:
+                    logger.exception("Failed to dump flight recorder")
+            raise
+
+    @contextmanager
+    def loop_restart_handler(self):
+        try:
+            with self.flight_recorder_handler():
+                yield
         except exceptions.FishCapturedError:
             self.handle_fish()
             if self.cfg.PROFILE.MODE == "bottom":
@@ -440,15 +527,20 @@ class Player:
 
     def reset_tackle(self) -> None:
         """Reset the tackle until it is ready."""
-        if self.detection.is_tackle_ready():
-            return
-        if self.detection.is_lure_broken():
+        with self.detection.frame():
+            if self.detection.is_tackle_ready():
+                return
+            lure_broken = self.detection.is_lure_broken()
+            dry_mix_chosen = self.detection.is_dry_mix_chosen()
+            bait_chosen = self.detection.is_bait_chosen()
+
+        if lure_broken:
             self._handle_broken_lure()
             return
-        if not self.detection.is_dry_mix_chosen():
+        if not dry_mix_chosen:
             self._refill_dry_mix()
             return
-        if not self.detection.is_bait_chosen():
+        if not bait_chosen:
             self.handle_bait_not_chosen()
             return
 
@@ -465,7 +557,8 @@ class Player:
     @contextmanager
     def error_handler(self):
         try:
-            yield
+            with self.flight_recorder_handler():
+                yield
         except exceptions.TicketExpiredError:
             self._handle_expired_ticket()
         except exceptions.CoffeeTimeoutError:
@@ -544,10 +637,12 @@ class Player:
 
     def retrieve_line(self) -> None:
         """Retrieve the fishing line until it is fully retrieved."""
-        if self.detection.is_retrieval_finished():
-            return
+        with self.detection.frame():
+            if self.detection.is_retrieval_finished():
+                return
+            fish_hooked = self.detection.is_fish_hooked()
 
-        if self.detection.is_fish_hooked():
+        if fish_hooked:
             self.pull_fish()
         else:
             with self.hold_keys(mouse=True, shift=False):
@@ -584,9 +679,26 @@ class Player:
                     break
 
     def save_bite_screenshot(self):
-        # TODO: This is slow!
         if self.cfg.ARGS.BITE:
-            self.detection.window.save_screenshot(self.timer.get_new_filepath())
+            self.save_screenshot()
+
+    def save_screenshot(self, send: bool = False, catch: bool = False) -> None:
+        """Capture the game window and save it in the background.
+
+        :param send: Whether to send the screenshot once it's saved.
+        :type send: bool
+        :param catch: Whether it's a screenshot of a caught fish, it's cropped to the
+            catch card if BOT.SCREENSHOT.CROP_TO_CATCH is enabled.
+        :type catch: bool
+        """
+        if catch and self.cfg.BOT.SCREENSHOT.CROP_TO_CATCH:
+            frame = self.detection.get_catch_frame()
+        else:
+            frame = self.detection.get_window_frame()
+        callback = None
+        if send:
+            callback = self.dispatcher.send_screenshot
+        self.screenshot_writer.save(frame, self.timer.get_new_filepath(), callback)
 
     def do_pirking(self) -> None:
         """Perform pirking until a fish is hooked."""
@@ -811,8 +923,10 @@ class Player:
         """
         result = self.get_result_dict(msg)
         result_table = self.get_result_table(result)
+        if self.screenshot_writer is not None:
+            self.screenshot_writer.stop()  # Queue the notifications of pending ones
         if send:
-            send_result(self.cfg, result)
+            self.dispatcher.send_result(result)
         if self.cfg.ARGS.DATA:
             output_dir = self.timer.get_new_dir_path()
             output_dir.mkdir()
@@ -821,9 +935,11 @@ class Player:
                 json.dump(result, f, indent=4)
             with open(output_dir / "config.yaml", "w") as f:
                 f.write(config.dump_cfg(self.cfg))
+        print(result_table)
+        # Send the result before the computer is shut down
+        self.dispatcher.flush(self.cfg.BOT.NOTIFICATION.FLUSH_TIMEOUT)
         if self.cfg.ARGS.SHUTDOWN and shutdown:
             os.system("shutdown /s /t 5")
-        print(result_table)
         if self.cfg.ARGS.FRICTION_BRAKE:
             self.friction_brake.monitor_process.terminate()
         with self.hold_keys(mouse=False, shift=False):
@@ -859,35 +975,37 @@ class Player:
         self.result.total += 1
         bypass = keep = fish_tagged = False
         tag_colors = []
-        for tag in TagColor:
-            if self.detection.is_tag_exist(tag):
-                tag_color = tag.name.lower()
-                tag_colors.append(tag_color)
-                if tag_color in self.cfg.BOT.KEEPNET.BYPASS_TAGS:
-                    bypass = True
-                if tag_color in self.cfg.BOT.KEEPNET.KEEP_TAGS:
-                    keep = True
-                if tag_color in self.cfg.BOT.KEEPNET.SCREENSHOT_TAGS:
-                    fish_tagged = True
+        blacklist = self.cfg.BOT.KEEPNET.BLACKLIST
+        whitelist = self.cfg.BOT.KEEPNET.WHITELIST
+        with self.detection.frame():
+            matches = self.detection.get_catch_matches((*blacklist, *whitelist))
+        tags = [tag for tag in TagColor if matches[tag.value]]
+        for tag in tags:
+            tag_color = tag.name.lower()
+            tag_colors.append(tag_color)
+            if tag_color in self.cfg.BOT.KEEPNET.BYPASS_TAGS:
+                bypass = True
+            if tag_color in self.cfg.BOT.KEEPNET.KEEP_TAGS:
+                keep = True
+            if tag_color in self.cfg.BOT.KEEPNET.SCREENSHOT_TAGS:
+                fish_tagged = True
 
         if (
             self.cfg.ARGS.SCREENSHOT
             and (not self.cfg.BOT.KEEPNET.SCREENSHOT_TAGS or fish_tagged)
             and "fish" in self.cfg.BOT.KEEPNET.SCREENSHOT_EVENTS
         ):
-            filepath = self.timer.get_new_filepath()
-            self.detection.window.save_screenshot(filepath)
-            send_screenshot(self.cfg, filepath)
+            self.save_screenshot(send=True, catch=True)
 
         if bypass:
             press("space")
             self.result.kept += 1
-        elif self.detection.is_fish_in_list(self.cfg.BOT.KEEPNET.BLACKLIST):
+        elif any(matches[species] for species in blacklist):
             press("backspace")
         elif (
             self.cfg.ARGS.TAG
             and not keep
-            and not self.detection.is_fish_in_list(self.cfg.BOT.KEEPNET.WHITELIST)
+            and not any(matches[species] for species in whitelist)
         ):
             press("backspace")
         else:
@@ -908,24 +1026,26 @@ class Player:
 
     def handle_events(self) -> None:
         """Handle events like gift, card, challenge, etc."""
-        while self.detection.is_event_triggered():
-            if self.detection.is_gift_receieved():
+        while True:
+            with self.detection.frame():
+                if not self.detection.is_event_triggered():
+                    break
+                gift_received = self.detection.is_gift_receieved()
+                card_received = not gift_received and self.detection.is_card_receieved()
+
+            if gift_received:
                 if (
                     self.cfg.ARGS.SCREENSHOT
                     and "gift" in self.cfg.BOT.KEEPNET.SCREENSHOT_EVENTS
                 ):
-                    filepath = self.timer.get_new_filepath()
-                    self.detection.window.save_screenshot(filepath)
-                    send_screenshot(self.cfg, filepath)
+                    self.save_screenshot(send=True)
                 self.result.gift += 1
-            elif self.detection.is_card_receieved():
+            elif card_received:
                 if (
                     self.cfg.ARGS.SCREENSHOT
                     and "card" in self.cfg.BOT.KEEPNET.SCREENSHOT_EVENTS
                 ):
-                    filepath = self.timer.get_new_filepath()
-                    self.detection.window.save_screenshot(filepath)
-                    send_screenshot(self.cfg, filepath)
+                    self.save_screenshot(send=True)
                 self.result.card += 1
             else:
                 logger.warning("Unexpected event detected")
@@ -977,6 +1097,12 @@ class Player:
     def get_result_dict(self, msg: str):
         return self.result.as_dict(msg, self.timer)
 
+    def get_summary_dict(self) -> dict:
+        """Get the running result without the fields about termination."""
+        result = self.get_result_dict("")
+        del result["Stop reason"], result["End time"]
+        return result
+
     def get_result_table(self, result) -> Table:
         """Create a Rich table from running result.
 
@@ -0,0 +1,160 @@
+"""Replay of recorded game frames for headless detection."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from rf4s.controller.capture import CaptureBackend, Frame
+from rf4s.controller.session import SessionReader
+
+# Same as Window.is_size_supported()
+SUPPORTED_RESOLUTIONS = ("2560x1440", "1920x1080", "1600x900")
+
+
+class ReplayCapture(CaptureBackend):
+    """Capture backend that serves recorded frames instead of the live screen.
+
+    Every frame is a screenshot of the game window placed at (0, 0), so it can be
+    used together with ReplayWindow. All grabs return the current frame until
+    another one is selected with seek(), seek_time() or by iterating over the
+    instance.
+
+    Attributes:
+        paths (list[Path]): Paths of the recorded frames, empty for a session file.
+        session (SessionReader | None): Reader of the session file.
+        index (int): Index of the current frame.
+    """
+
+    def __init__(self, source: Path | str):
+        """Collect recorded frames from a directory of PNGs or a session file.
+
+        :param source: Directory containing the frames, or a session file.
+        :type source: Path | str
+        """
+        source = Path(source)
+        self.paths = []
+        self.session = None
+        if source.is_file():
+            self.session = SessionReader(source)
+        elif source.is_dir():
+            self.paths = sorted(source.glob("*.png"))
+        else:
+            raise FileNotFoundError(source)
+        if not len(self):
+            raise FileNotFoundError(f"No frames found in {source}")
+        self.index = 0
+        self._frame = None
+
+    def __len__(self) -> int:
+        if self.session is not None:
+            return len(self.session)
+        return len(self.paths)
+
+    def __iter__(self):
+        """Select each frame in turn and yield its name."""
+        for index in range(len(self)):
+            self.seek(index)
+            yield self.get_frame_name(index)
+
+    def get_frame_name(self, index: int) -> str:
+        """Get the name of a frame, its filename or its index in the session.
+
+        :param index: Index of the frame.
+        :type index: int
+        :return: Name of the frame.
+        :rtype: str
+        """
+        if self.session is not None:
+            return f"{index:06d}"
+        return self.paths[index].name
+
+    def seek(self, index: int) -> None:
+        """Select the frame to serve.
+
+        :param index: Index of the frame.
+        :type index: int
+        """
+        self.index = index
+        self._frame = None
+
+    def seek_time(self, timestamp: float) -> None:
+        """Select the last frame of the session recorded at or before a timestamp.
+
+        :param timestamp: Time to look up.
+        :type timestamp: float
+        :raises ValueError: The frames are not from a session file.
+        """
+        if self.session is None:
+            raise ValueError("Frames without timestamps can't be sought by time")
+        self.seek(self.session.find(timestamp))
+
+    def get_current_frame(self) -> Frame:
+        """Decode the current frame on first use.
+
+        :return: Current frame.
+        :rtype: Frame
+        """
+        if self._frame is None and self.session is not None:
+            bgr, _ = self.session.read(self.index)
+            # Downscaled sessions are scaled back to the size of the game window
+            size = (
+                self.session.info.get("window_width", self.session.width),
+                self.session.info.get("window_height", self.session.height),
+            )
+            if size != (self.session.width, self.session.height):
+                bgr = cv2.resize(bgr, size, interpolation=cv2.INTER_LINEAR)
+            self._frame = Frame(cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA), 0, 0)
+        elif self._frame is None:
+            path = self.paths[self.index]
+            bgra = cv2.imdecode(np.fromfile(path, np.uint8), cv2.IMREAD_UNCHANGED)
+            if bgra is None:
+                raise IOError(f"Failed to decode {path}")
+            if bgra.ndim == 2:
+                bgra = cv2.cvtColor(bgra, cv2.COLOR_GRAY2BGRA)
+            elif bgra.shape[2] == 3:
+                bgra = cv2.cvtColor(bgra, cv2.COLOR_BGR2BGRA)
+            self._frame = Frame(bgra, 0, 0)
+        return self._frame
+
+    def grab(self, region: tuple | list | None = None) -> Frame:
+        frame = self.get_current_frame()
+        if region is None:
+            return frame
+        return frame.crop(region)
+
+
+class ReplayWindow:
+    """Stand-in for Window when detection runs on recorded frames.
+
+    Only the geometry methods used by Detection are provided.
+
+    Attributes:
+        width (int): Width of the recorded game window.
+        height (int): Height of the recorded game window.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_capture(cls, capture: ReplayCapture) -> "ReplayWindow":
+        """Create a window with the size of the current recorded frame.
+
+        :param capture: Replay capture backend.
+        :type capture: ReplayCapture
+        :return: Window of the same size as the frames.
+        :rtype: ReplayWindow
+        """
+        frame = capture.get_current_frame()
+        return cls(frame.width, frame.height)
+
+    def get_box(self) -> tuple[int, int, int, int]:
+        return 0, 0, self.width, self.height
+
+    def get_resolution_str(self) -> str:
+        return f"{self.width}x{self.height}"
+
+    def is_size_supported(self) -> bool:
+        return self.get_resolution_str() in SUPPORTED_RESOLUTIONS
@@ -0,0 +1,61 @@
+"""Adaptive polling delays for the stages of the tackle loops."""
+
+from rf4s.controller.timer import Timer
+
+# Stage: (minimum delay, maximum delay) in seconds
+# A bite can come at any time during reset, retrieval and sinking, so they're never
+# polled slower than the fixed LOOP_DELAY (0.5s) of the tackle loops.
+POLL_POLICIES = {
+    "reset": (0.1, 0.5),
+    "retrieve": (0.1, 0.5),
+    "pull": (0.25, 1),
+    "lift": (0.25, 1),
+    "sink": (0.1, 0.5),
+}
+# Fraction of the distance to the expected transition used as the delay
+POLL_FRACTION = 0.25
+
+
+class PollingScheduler:
+    """Choose the delay between two polls of a stage from its recent durations.
+
+    Polling is fast when the elapsed time is close to the expected end of the stage
+    (e.g., the end of a retrieval or a sinking lure reaching the bottom), and slows
+    down during long waits before it and in the long tail after it.
+
+    Attributes:
+        timer (Timer): Timer that records the stage durations.
+    """
+
+    def __init__(self, timer: Timer):
+        """Initialize the scheduler with the timer of the bot.
+
+        :param timer: Timer that records the stage durations.
+        :type timer: Timer
+        """
+        self.timer = timer
+
+    def get_delay(self, stage: str, default: float) -> float:
+        """Get the delay before the next poll of a stage.
+
+        :param stage: Name of the stage, a key of POLL_POLICIES.
+        :type stage: str
+        :param default: Delay to use while the stage has no recorded duration.
+        :type default: float
+        :return: Delay in seconds.
+        :rtype: float
+        """
+        expected = self.timer.get_expected_stage_duration(stage)
+        if expected is None:
+            return default
+        min_delay, max_delay = POLL_POLICIES[stage]
+        distance = abs(expected - self.timer.get_stage_elapsed_time())
+        return min(max(distance * POLL_FRACTION, min_delay), max_delay)
+
+    def record(self, stage: str) -> None:
+        """Record the duration of a stage that has reached its expected end.
+
+        :param stage: Name of the stage, a key of POLL_POLICIES.
+        :type stage: str
+        """
+        self.timer.record_stage_duration(stage)
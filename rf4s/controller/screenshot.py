@@ -0,0 +1,214 @@
+"""Background writer for screenshots and their shared in-memory payload."""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+from yacs.config import CfgNode as CN
+
+from rf4s.controller.capture import Frame
+from rf4s.controller.logger import logger
+
+SUFFIXES = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+FORMATS = {suffix: fmt for fmt, suffix in SUFFIXES.items()}
+
+
+def get_encode_params(settings: CN, fmt: str) -> list[int]:
+    """Get the OpenCV encoding parameters of an image format.
+
+    :param settings: Screenshot settings (BOT.SCREENSHOT).
+    :type settings: CN
+    :param fmt: Image format, a key of SUFFIXES.
+    :type fmt: str
+    :return: Parameters for cv2.imencode().
+    :rtype: list[int]
+    """
+    match fmt:
+        case "png":
+            return [cv2.IMWRITE_PNG_COMPRESSION, settings.PNG_COMPRESSION]
+        case "jpeg":
+            return [cv2.IMWRITE_JPEG_QUALITY, settings.QUALITY]
+        case "webp":
+            return [cv2.IMWRITE_WEBP_QUALITY, settings.QUALITY]
+        case _:
+            raise ValueError(fmt)
+
+
+def encode_frame(cfg: CN, frame: Frame) -> bytes:
+    """Encode a frame with the screenshot settings.
+
+    :param cfg: Configuration node.
+    :type cfg: CN
+    :param frame: Captured frame.
+    :type frame: Frame
+    :return: Encoded image.
+    :rtype: bytes
+    """
+    settings = cfg.BOT.SCREENSHOT
+    image = frame.bgr
+    scale = settings.MAX_DIMENSION / max(frame.width, frame.height)
+    if 0 < scale < 1:
+        size = round(frame.width * scale), round(frame.height * scale)
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    params = get_encode_params(settings, settings.FORMAT)
+    success, buffer = cv2.imencode(SUFFIXES[settings.FORMAT], image, params)
+    if not success:
+        raise IOError(f"Failed to encode screenshot as {settings.FORMAT}")
+    return buffer.tobytes()
+
+
+class ScreenshotPayload:
+    """Encoded screenshot shared by all notification channels.
+
+    The image is read from disk at most once, or not at all if it's given by the
+    writer. Its bytes are never modified, derived data like resized images or MIME
+    parts are created once by the first channel that needs them and cached here, so
+    the cost of a catch doesn't grow with the number of enabled channels.
+
+    Attributes:
+        filepath (Path): Path of the saved screenshot.
+        settings (CN): Screenshot settings used to encode the resized variants.
+    """
+
+    def __init__(self, filepath: Path, settings: CN, data: bytes | None = None):
+        """Wrap a screenshot, it's read lazily if its bytes are not given.
+
+        :param filepath: Path of the saved screenshot.
+        :type filepath: Path
+        :param settings: Screenshot settings (BOT.SCREENSHOT).
+        :type settings: CN
+        :param data: Encoded image, defaults to None.
+        :type data: bytes | None, optional
+        """
+        self.filepath = filepath
+        self.settings = settings
+        self._data = data
+        self._variants = {}
+        self._lock = threading.RLock()
+
+    @property
+    def name(self) -> str:
+        return self.filepath.name
+
+    @property
+    def data(self) -> bytes:
+        with self._lock:
+            if self._data is None:
+                self._data = self.filepath.read_bytes()
+            return self._data
+
+    def get_variant(self, key: Any, create: Callable[["ScreenshotPayload"], Any]):
+        """Get data derived from the screenshot, creating it on first use.
+
+        :param key: Key of the variant, unique among the channels.
+        :type key: Any
+        :param create: Function to create the variant from the payload.
+        :type create: Callable[[ScreenshotPayload], Any]
+        :return: The cached variant, it must not be modified.
+        """
+        with self._lock:
+            if key not in self._variants:
+                self._variants[key] = create(self)
+            return self._variants[key]
+
+    def resize(self, max_dimension: int) -> bytes:
+        """Get the image downscaled to fit a maximum dimension, in the same format.
+
+        :param max_dimension: Maximum length of the longer side.
+        :type max_dimension: int
+        :return: Encoded image, the original one if it already fits.
+        :rtype: bytes
+        """
+        return self.get_variant(
+            ("resize", max_dimension), lambda _: self._resize(max_dimension)
+        )
+
+    def _resize(self, max_dimension: int) -> bytes:
+        image = cv2.imdecode(np.frombuffer(self.data, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise IOError(f"Failed to decode screenshot {self.filepath}")
+        height, width = image.shape[:2]
+        scale = max_dimension / max(width, height)
+        if scale >= 1:
+            return self.data
+        size = round(width * scale), round(height * scale)
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        params = get_encode_params(self.settings, FORMATS[self.filepath.suffix])
+        success, buffer = cv2.imencode(self.filepath.suffix, image, params)
+        if not success:
+            raise IOError(f"Failed to encode screenshot {self.filepath}")
+        return buffer.tobytes()
+
+
+class ScreenshotWriter:
+    """Thread that encodes and saves captured frames in the background.
+
+    The caller only captures the frame in memory, so pulling a fish or handling a
+    catch never waits for the encoder or the disk.
+
+    Attributes:
+        cfg (CN): Configuration node with the screenshot settings.
+    """
+
+    def __init__(self, cfg: CN):
+        """Set up the writer, call start() to run it.
+
+        :param cfg: Configuration node with the screenshot settings.
+        :type cfg: CN
+        """
+        self.cfg = cfg
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Save the pending screenshots and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def save(
+        self,
+        frame: Frame,
+        filepath: Path,
+        callback: Callable[[ScreenshotPayload], None] | None = None,
+    ) -> None:
+        """Queue a frame to be saved.
+
+        :param frame: Captured frame, it must not be modified afterwards.
+        :type frame: Frame
+        :param filepath: Destination of the screenshot, its suffix is replaced
+            according to the image format.
+        :type filepath: Path
+        :param callback: Function to call with the encoded screenshot once it's
+            saved, e.g., to send it as a notification, defaults to None.
+        :type callback: Callable[[ScreenshotPayload], None] | None, optional
+        """
+        self._queue.put((frame, filepath, callback))
+
+    def _run(self) -> None:
+        """Save the queued frames until stopped."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            frame, filepath, callback = job
+            try:
+                filepath = filepath.with_suffix(
+                    SUFFIXES[self.cfg.BOT.SCREENSHOT.FORMAT]
+                )
+                data = encode_frame(self.cfg, frame)
+                filepath.write_bytes(data)
+            except Exception:
+                logger.exception("Failed to save screenshot %s", filepath)
+                continue
+            if callback is not None:
+                try:
+                    callback(ScreenshotPayload(filepath, self.cfg.BOT.SCREENSHOT, data))
+                except Exception:
+                    logger.exception("Failed to handle screenshot %s", filepath)
@@ -0,0 +1,347 @@
+"""Compressed recording of game sessions for offline replay.
+
+A session file starts with a header, followed by chunks of frames:
+
+    header: MAGIC, version (u16), length of the JSON info (u32), JSON info
+    chunk:  size of the payload (u32), number of frames (u32),
+            timestamps of the frames (f64 each), zstd-compressed payload
+
+The payload of a chunk holds, for each frame, the length of its JSON metadata
+(u32), the metadata (stage and detection results), then the BGR pixels XORed
+with the previous frame of the chunk. Consecutive frames are mostly the same,
+so the deltas are mostly zeros and compress far better than the frames. The
+first frame of a chunk is stored as is, so each chunk is decoded on its own.
+Timestamps are stored outside of the payload, so the index is built without
+decompressing anything, and a file cut off by a crash is still readable.
+"""
+
+import bisect
+import copy
+import json
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import cv2
+import numpy as np
+import zstandard as zstd
+
+from rf4s.controller.detection import Detection, GameState
+from rf4s.controller.logger import logger
+
+MAGIC = b"RF4SSESS"
+VERSION = 2
+SESSION_SUFFIX = ".session"
+CHUNK_BYTES = 64 * 1024 * 1024  # Uncompressed size of a chunk, bounds the reader
+
+HEADER = struct.Struct("<HI")
+CHUNK_HEADER = struct.Struct("<II")
+META_LENGTH = struct.Struct("<I")
+
+
+class SessionWriter:
+    """Writer of session files.
+
+    Attributes:
+        width (int): Width of the frames.
+        height (int): Height of the frames.
+    """
+
+    def __init__(self, path: Path, width: int, height: int, info: dict, level: int):
+        """Create the file and write the header.
+
+        :param path: Path of the session file.
+        :type path: Path
+        :param width: Width of the frames.
+        :type width: int
+        :param height: Height of the frames.
+        :type height: int
+        :param info: Extra information to store in the header.
+        :type info: dict
+        :param level: zstd compression level.
+        :type level: int
+        """
+        self.width = width
+        self.height = height
+        self._compressor = zstd.ZstdCompressor(level=level)
+        self._stream = None  # Compressor of the current chunk
+        self._timestamps = []
+        self._payload = []  # Compressed parts of the current chunk
+        self._size = 0  # Uncompressed size of the current chunk
+        self._previous = None
+        self._file = open(path, "wb")
+        info = json.dumps({**info, "width": width, "height": height}).encode()
+        self._file.write(MAGIC + HEADER.pack(VERSION, len(info)) + info)
+
+    def add(self, bgr: np.ndarray, timestamp: float, meta: dict) -> None:
+        """Compress a frame into the current chunk, it's written once it's full.
+
+        :param bgr: BGR pixels with shape (height, width, 3).
+        :type bgr: np.ndarray
+        :param timestamp: Time when the frame is captured.
+        :type timestamp: float
+        :param meta: JSON-serializable metadata of the frame.
+        :type meta: dict
+        """
+        if bgr.shape != (self.height, self.width, 3):
+            raise ValueError(f"Unexpected frame shape {bgr.shape}")
+        meta = json.dumps(meta).encode()
+        if self._stream is None:
+            self._stream = self._compressor.compressobj()
+            delta = bgr
+        else:
+            delta = np.bitwise_xor(bgr, self._previous)
+        self._previous = np.array(bgr)  # The caller may reuse its buffer
+        self._payload.append(self._stream.compress(META_LENGTH.pack(len(meta)) + meta))
+        self._payload.append(self._stream.compress(np.ascontiguousarray(delta)))
+        self._size += META_LENGTH.size + len(meta) + delta.nbytes
+        self._timestamps.append(timestamp)
+        if self._size >= CHUNK_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        """Compress and write the pending frames as a chunk."""
+        if not self._timestamps:
+            return
+        count = len(self._timestamps)
+        self._payload.append(self._stream.flush())
+        size = sum(len(part) for part in self._payload)
+        self._file.write(CHUNK_HEADER.pack(size, count))
+        self._file.write(struct.pack(f"<{count}d", *self._timestamps))
+        self._file.writelines(self._payload)
+        self._file.flush()
+        self._stream = None
+        self._timestamps.clear()
+        self._payload.clear()
+        self._size = 0
+        self._previous = None
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+
+class SessionReader:
+    """Reader of session files with random access by index or timestamp.
+
+    Attributes:
+        info (dict): Information stored in the header.
+        width (int): Width of the frames.
+        height (int): Height of the frames.
+        timestamps (list[float]): Timestamps of all frames, in recording order.
+    """
+
+    def __init__(self, path: Path | str):
+        """Open a session file and index its chunks.
+
+        :param path: Path of the session file.
+        :type path: Path | str
+        :raises ValueError: The file is not a session file of a supported version.
+        """
+        self._file = open(path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"{path} is not a session file")
+        version, info_length = HEADER.unpack(self._file.read(HEADER.size))
+        if version != VERSION:
+            self._file.close()
+            raise ValueError(f"Unsupported session version: {version}")
+        self.info = json.loads(self._file.read(info_length))
+        self._data_offset = len(MAGIC) + HEADER.size + info_length
+        self.width = self.info["width"]
+        self.height = self.info["height"]
+
+        self.timestamps = []
+        self._chunks = []  # (payload offset, payload size, index of the first frame)
+        self._decompressor = zstd.ZstdDecompressor()
+        self._cached_chunk = None
+        self._cached_records = None
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Collect the chunk offsets and timestamps, ignoring a truncated tail."""
+        file_size = self._file.seek(0, 2)
+        offset = self._file.seek(self._data_offset)
+        while offset + CHUNK_HEADER.size <= file_size:
+            size, count = CHUNK_HEADER.unpack(self._file.read(CHUNK_HEADER.size))
+            payload_offset = offset + CHUNK_HEADER.size + count * 8
+            if payload_offset + size > file_size:
+                logger.warning("Session file is truncated, the last chunk is skipped")
+                break
+            timestamps = struct.unpack(f"<{count}d", self._file.read(count * 8))
+            self._chunks.append((payload_offset, size, len(self.timestamps)))
+            self.timestamps.extend(timestamps)
+            offset = self._file.seek(payload_offset + size)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def find(self, timestamp: float) -> int:
+        """Find the last frame captured at or before a timestamp.
+
+        :param timestamp: Time to look up.
+        :type timestamp: float
+        :return: Index of the frame, the first one if the time is before it.
+        :rtype: int
+        """
+        return max(bisect.bisect_right(self.timestamps, timestamp) - 1, 0)
+
+    def _read_chunk(self, chunk: int) -> list[tuple[dict, np.ndarray]]:
+        """Decompress a chunk, the last one is cached for sequential reads.
+
+        :param chunk: Index of the chunk.
+        :type chunk: int
+        :return: Metadata and BGR pixels of the frames in the chunk.
+        :rtype: list[tuple[dict, np.ndarray]]
+        """
+        if chunk != self._cached_chunk:
+            offset, size, _ = self._chunks[chunk]
+            self._file.seek(offset)
+            # The content size is unknown to a streamed chunk, so decompress it
+            # with a stream as well
+            stream = self._decompressor.decompressobj()
+            payload = memoryview(stream.decompress(self._file.read(size)))
+            shape = (self.height, self.width, 3)
+            frame_size = self.width * self.height * 3
+            records = []
+            previous = None
+            position = 0
+            while position < len(payload):
+                (meta_length,) = META_LENGTH.unpack_from(payload, position)
+                position += META_LENGTH.size
+                meta = json.loads(bytes(payload[position : position + meta_length]))
+                position += meta_length
+                bgr = np.frombuffer(
+                    payload[position : position + frame_size], dtype=np.uint8
+                ).reshape(shape)
+                if previous is not None:
+                    bgr = np.bitwise_xor(bgr, previous)
+                records.append((meta, bgr))
+                previous = bgr
+                position += frame_size
+            self._cached_chunk, self._cached_records = chunk, records
+        return self._cached_records
+
+    def read(self, index: int) -> tuple[np.ndarray, dict]:
+        """Read a frame by its index.
+
+        :param index: Index of the frame.
+        :type index: int
+        :return: BGR pixels and metadata of the frame.
+        :rtype: tuple[np.ndarray, dict]
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        chunk = bisect.bisect_right(self._chunks, index, key=lambda c: c[2]) - 1
+        meta, bgr = self._read_chunk(chunk)[index - self._chunks[chunk][2]]
+        return bgr, meta
+
+    def read_at(self, timestamp: float) -> tuple[np.ndarray, dict]:
+        """Read the last frame captured at or before a timestamp.
+
+        :param timestamp: Time to look up.
+        :type timestamp: float
+        :return: BGR pixels and metadata of the frame.
+        :rtype: tuple[np.ndarray, dict]
+        """
+        return self.read(self.find(timestamp))
+
+
+class SessionRecorder:
+    """Thread that records the game window and its detection results.
+
+    Attributes:
+        detection (Detection): Detection instance owned by the recorder thread.
+        interval (float): Time between two frames.
+        size (tuple[int, int] | None): Size of the recorded frames, None if they
+            are not downscaled.
+    """
+
+    def __init__(
+        self,
+        detection: Detection,
+        path: Path,
+        rate: float,
+        level: int,
+        max_dimension: int,
+        get_stage: Callable[[], str | None],
+    ):
+        """Create the session file, call start() to run the recorder.
+
+        :param detection: Detection instance to copy for the recorder thread.
+        :type detection: Detection
+        :param path: Path of the session file.
+        :type path: Path
+        :param rate: Number of frames per second.
+        :type rate: float
+        :param level: zstd compression level.
+        :type level: int
+        :param max_dimension: Maximum length of the longer side of a recorded
+            frame, 0 to keep the original size.
+        :type max_dimension: int
+        :param get_stage: Function to get the name of the current stage.
+        :type get_stage: Callable[[], str | None]
+        """
+        # Use a copy so the frames of both threads don't interfere with each other
+        self.detection = copy.copy(detection)
+        self.interval = 1 / rate
+        self.get_stage = get_stage
+        _, _, width, height = detection.window.get_box()
+        scale = max_dimension / max(width, height)
+        self.size = None  # Original size
+        if 0 < scale < 1:
+            self.size = (round(width * scale), round(height * scale))
+        info = {
+            "rate": rate,
+            "language": detection.cfg.LANGUAGE,
+            "mode": detection.cfg.PROFILE.MODE,
+            "window_width": width,
+            "window_height": height,
+        }
+        self.writer = SessionWriter(path, *(self.size or (width, height)), info, level)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        logger.info("Starting session recorder")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.writer.close()
+
+    def _run(self) -> None:
+        """Record a frame with its detection results at a fixed rate until stopped."""
+        while not self._stopped.is_set():
+            try:
+                self._record()
+            except Exception:
+                logger.exception("Failed to record session frame")
+            self._stopped.wait(self.interval)
+
+    def _record(self) -> None:
+        timestamp = time.time()
+        with self.detection.frame():
+            frame = self.detection.get_window_frame()
+            state = self.detection.get_game_state()
+        meta = {
+            "stage": self.get_stage(),
+            "state": {flag: getattr(state, flag) for flag in GameState.__slots__},
+        }
+        bgr = frame.bgr
+        if self.size is not None:
+            bgr = cv2.resize(bgr, self.size, interpolation=cv2.INTER_AREA)
+        self.writer.add(bgr, timestamp, meta)
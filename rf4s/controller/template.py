@@ -0,0 +1,73 @@
+"""Registry of decoded template images for image detection."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+
+class TemplateRegistry:
+    """Decoded template images keyed by name, loaded once for the whole session.
+
+    Every PNG under the image directory is read and decoded at startup, so the
+    polling loops never touch the disk or decode an image again. If the game UI is
+    drawn at a different scale than the reference images, they are rescaled once
+    here as well.
+
+    Attributes:
+        image_dir (Path): Directory containing reference images for detection.
+        scale (float): Scale factor applied to the reference images.
+        color (dict[str, np.ndarray]): BGR templates keyed by image base name.
+        gray (dict[str, np.ndarray]): Grayscale templates keyed by image base name.
+    """
+
+    def __init__(self, image_dir: Path, scale: float = 1.0):
+        """Load and decode all templates in the image directory.
+
+        :param image_dir: Directory containing reference images for detection.
+        :type image_dir: Path
+        :param scale: Scale factor applied to the reference images, defaults to 1.0.
+        :type scale: float, optional
+        """
+        self.image_dir = image_dir
+        self.scale = scale
+        self.color = {}
+        self.gray = {}
+        for path in sorted(image_dir.glob("*.png")):
+            self._load(path)
+
+    def _load(self, path: Path) -> None:
+        """Decode an image and store its color and grayscale versions.
+
+        cv2.imread() can't handle non-ASCII paths on Windows, so the file is read
+        by numpy and decoded from memory instead.
+
+        :param path: Path of the image.
+        :type path: Path
+        """
+        color = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if color is None:
+            raise IOError(f"Failed to decode {path}")
+        if self.scale != 1.0:
+            interpolation = cv2.INTER_AREA if self.scale < 1 else cv2.INTER_LINEAR
+            color = cv2.resize(
+                color, None, fx=self.scale, fy=self.scale, interpolation=interpolation
+            )
+        self.color[path.stem] = color
+        self.gray[path.stem] = cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+
+    def get(self, name: str, grayscale: bool = True) -> np.ndarray:
+        """Get a ready-to-match template by name.
+
+        :param name: Base name of the image.
+        :type name: str
+        :param grayscale: Whether to return the grayscale version, defaults to True.
+        :type grayscale: bool, optional
+        :return: Decoded template.
+        :rtype: np.ndarray
+        """
+        templates = self.gray if grayscale else self.color
+        try:
+            return templates[name]
+        except KeyError:
+            raise FileNotFoundError(self.image_dir / f"{name}.png") from None
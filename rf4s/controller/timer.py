@@ -1,8 +1,10 @@
 """Class to store the bot's timers."""
 
 import datetime
+import statistics
 import sys
 import time
+from collections import deque
 from pathlib import Path
 
 from matplotlib import pyplot as plt
@@ -20,6 +22,7 @@ else:
     OUTER_ROOT = Path(__file__).resolve().parents[2]
 
 RARE_EVENT_TIMEOUT = 16
+STAGE_HISTORY_SIZE = 16
 
 
 class Timer:
@@ -41,6 +44,7 @@ class Timer:
         last_lure_change (float): Timestamp of the last lure change.
         last_spod_rod_recast (float): Timestamp of the last spod rod recast.
         last_pause (float): Timestamp of the last script pause.
+        stage_durations (dict[str, deque[float]]): Recent durations of each stage.
     """
 
     def __init__(self, cfg):
@@ -70,6 +74,7 @@ class Timer:
         self.last_pause = self.start_time
 
         self.timeout_start_time = 0
+        self.stage_durations = {}
 
     def get_running_time(self) -> float:
         """Calculate the execution time of the program.
@@ -257,6 +262,38 @@ class Timer:
         self.last_elevate_timeout = self.timeout_start_time
         self.last_lift_timeout = self.timeout_start_time
 
+    def get_stage_elapsed_time(self) -> float:
+        """Get the time since the current stage started.
+
+        :return: Elapsed time in seconds.
+        :rtype: float
+        """
+        return time.time() - self.timeout_start_time
+
+    def record_stage_duration(self, stage: str) -> None:
+        """Record the duration of a stage that has just finished.
+
+        :param stage: Name of the stage.
+        :type stage: str
+        """
+        durations = self.stage_durations.setdefault(
+            stage, deque(maxlen=STAGE_HISTORY_SIZE)
+        )
+        durations.append(self.get_stage_elapsed_time())
+
+    def get_expected_stage_duration(self, stage: str) -> float | None:
+        """Estimate the duration of a stage from the recent ones.
+
+        :param stage: Name of the stage.
+        :type stage: str
+        :return: Median of the recent durations, None if there's no record.
+        :rtype: float | None
+        """
+        durations = self.stage_durations.get(stage)
+        if not durations:
+            return None
+        return statistics.median(durations)
+
     def is_rare_event_checkable(self):
         cur_time = time.time()
         if cur_time - self.last_rare_event_check > RARE_EVENT_TIMEOUT:
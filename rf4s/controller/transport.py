@@ -0,0 +1,256 @@
+"""Pooled connections shared by the notification channels."""
+
+import smtplib
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from rf4s.controller.logger import logger
+
+SMTP_PORT = 465
+BACKOFF_BASE = 1
+BACKOFF_MAX = 32
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def get_retry_after(response: requests.Response) -> float | None:
+    """Get the back-off delay requested by the server.
+
+    Discord puts it in the body and the Retry-After header, Telegram puts it in the
+    parameters of the body.
+
+    :param response: Response of the server.
+    :type response: requests.Response
+    :return: Delay in seconds, None if not requested.
+    :rtype: float | None
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if isinstance(body, dict):
+        retry_after = body.get("retry_after")
+        if retry_after is None and isinstance(body.get("parameters"), dict):
+            retry_after = body["parameters"].get("retry_after")
+        if retry_after is not None:
+            return float(retry_after)
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by the requests of a channel.
+
+    Attributes:
+        rate (float): Tokens refilled per second.
+        capacity (float): Maximum number of tokens, i.e., the allowed burst.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket.
+
+        :param rate: Tokens refilled per second.
+        :type rate: float
+        :param capacity: Maximum number of tokens.
+        :type capacity: float
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now > self._last_refill:
+            elapsed = now - self._last_refill
+            self._tokens = min(self._tokens + elapsed * self.rate, self.capacity)
+            self._last_refill = now
+
+    def acquire(self) -> None:
+        """Take a token, blocking until one is available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def pause(self, delay: float) -> None:
+        """Empty the bucket and stop the refill for a while, e.g., on a 429.
+
+        :param delay: Time before the refill resumes.
+        :type delay: float
+        """
+        with self._lock:
+            self._tokens = 0
+            self._last_refill = max(self._last_refill, time.monotonic() + delay)
+
+
+class HttpTransport:
+    """HTTP client with a keep-alive session per host.
+
+    Messages sent in a burst reuse the same connection instead of repeating the
+    TLS handshake. requests.Session is safe to share between the worker threads
+    for this kind of usage.
+
+    Failed requests are retried with a bounded exponential backoff, or after the
+    delay requested by the server if it's rate limited.
+
+    Attributes:
+        timeout (tuple[float, float]): Connect and read timeouts of a request.
+        max_retries (int): Maximum number of retries of a request.
+    """
+
+    def __init__(self, connect_timeout: float, read_timeout: float, max_retries: int):
+        """Initialize the transport, sessions are created on first use.
+
+        :param connect_timeout: Timeout of establishing a connection.
+        :type connect_timeout: float
+        :param read_timeout: Timeout of waiting for the server to respond.
+        :type read_timeout: float
+        :param max_retries: Maximum number of retries of a request.
+        :type max_retries: int
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._sessions[host] = requests.Session()
+            return session
+
+    def request(
+        self, method: str, url: str, bucket: TokenBucket | None = None, **kwargs
+    ) -> requests.Response:
+        """Send a request through the session of its host, retrying on failures.
+
+        Files must be given as bytes so they can be sent again.
+
+        :param method: HTTP method.
+        :type method: str
+        :param url: URL of the request.
+        :type url: str
+        :param bucket: Rate limiter of the channel, defaults to None.
+        :type bucket: TokenBucket | None, optional
+        :raises requests.RequestException: The connection failed after all retries.
+        :return: Response of the server, the last one if all retries failed.
+        :rtype: requests.Response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._get_session(url)
+        for attempt in range(self.max_retries + 1):
+            if bucket is not None:
+                bucket.acquire()
+            backoff = min(BACKOFF_BASE * 2**attempt, BACKOFF_MAX)
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay, reason = backoff, type(e).__name__
+            else:
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == self.max_retries
+                ):
+                    return response
+                retry_after = get_retry_after(response)
+                if retry_after is not None and bucket is not None:
+                    # Hold back the other requests of the channel as well, the next
+                    # acquire() waits until the delay is over.
+                    bucket.pause(retry_after)
+                    logger.warning("Rate limited, retrying in %.1fs", retry_after)
+                    continue
+                delay = backoff if retry_after is None else retry_after
+                reason = f"status {response.status_code}"
+            logger.warning("Request failed (%s), retrying in %.1fs", reason, delay)
+            time.sleep(delay)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+class SmtpTransport:
+    """SMTP client that keeps its authenticated connection between messages.
+
+    The connection is opened on the first message, and opened again if the server
+    has closed it in the meantime.
+    """
+
+    def __init__(self, server: str, email: str, password: str, timeout: float):
+        """Initialize the transport, the connection is opened on first use.
+
+        :param server: Address of the SMTP server.
+        :type server: str
+        :param email: Email address used to log in.
+        :type email: str
+        :param password: Password used to log in.
+        :type password: str
+        :param timeout: Timeout of the socket operations.
+        :type timeout: float
+        """
+        self.server = server
+        self.email = email
+        self.password = password
+        self.timeout = timeout
+        self._smtp = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP_SSL:
+        logger.info("Connecting to SMTP server")
+        smtp = smtplib.SMTP_SSL(self.server, SMTP_PORT, timeout=self.timeout)
+        try:
+            smtp.login(self.email, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    def send(self, to_addrs: list[str], msg: str) -> None:
+        """Send a message, reconnecting once if the connection is dropped.
+
+        :param to_addrs: Addresses of the recipients.
+        :type to_addrs: list[str]
+        :param msg: The whole message, including its headers.
+        :type msg: str
+        """
+        with self._lock:
+            if self._smtp is None:
+                self._smtp = self._connect()
+            try:
+                self._smtp.sendmail(self.email, to_addrs, msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._smtp.close()
+                self._smtp = None
+                self._smtp = self._connect()
+                self._smtp.sendmail(self.email, to_addrs, msg)
+            except Exception:
+                # The connection may be in an unknown state, don't reuse it
+                self._smtp.close()
+                self._smtp = None
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            if self._smtp is None:
+                return
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
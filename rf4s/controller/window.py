@@ -1,10 +1,8 @@
 """Class to get info and control the game window."""
 
-from pathlib import Path
 from time import sleep
 
 # import win32api, win32con
-import pyautogui as pag
 import win32con
 import win32gui
 
@@ -119,13 +117,6 @@ class Window:
             "1600x900",
         )
 
-    def save_screenshot(self, filepath: Path) -> None:
-        """Save a screenshot of the game window to the screenshots directory."""
-        pag.screenshot(
-            imageFilename=filepath,
-            region=self.get_box(),
-        )
-
 
 if __name__ == "__main__":
     w = Window("Russian Fishing 4")
@@ -97,3 +97,7 @@ class DryMixNotFoundError(Exception):
 
 class DriftTimeoutError(Exception):
     """Bait drifting times out during float fishing"""
+
+
+class NotificationError(Exception):
+    """Notification is not delivered, but it can be sent again later."""
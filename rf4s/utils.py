@@ -2,14 +2,12 @@
 
 import ctypes
 import datetime
-import msvcrt
 import random
 import sys
 import logging
 import logging.config
 from time import sleep
 
-import pyautogui as pag
 import rich.logging  # noqa: F401
 from pyscreeze import Box
 from rich import box, print
@@ -17,6 +15,14 @@ from rich.panel import Panel
 
 from rf4s.controller.console import console
 
+# Input control is only available on Windows, but detection can also run headlessly
+# on recorded frames (see rf4s.controller.replay).
+try:
+    import msvcrt
+    import pyautogui as pag
+except (ImportError, KeyError):  # KeyError: no DISPLAY for pyautogui on Linux
+    msvcrt = pag = None
+
 LOOP_DELAY = 1
 
 ANIMATION_DELAY = 0.5
@@ -0,0 +1,94 @@
+"""Tests of the rate limiter and retries against a local stand-in server."""
+
+import http.server
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+from rf4s.controller import transport
+from rf4s.controller.transport import HttpTransport, TokenBucket
+
+
+class ScriptedHandler(http.server.BaseHTTPRequestHandler):
+    """Reply with the next scripted (status, body) response, then with 200."""
+
+    responses = []
+    request_times = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.request_times.append(time.monotonic())
+        status, body = self.responses.pop(0) if self.responses else (200, {})
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_):
+        pass
+
+
+class TestHttpTransport(unittest.TestCase):
+    def setUp(self):
+        ScriptedHandler.responses = []
+        ScriptedHandler.request_times = []
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/webhook"
+        self.http = HttpTransport(1, 1, max_retries=3)
+
+    def tearDown(self):
+        self.http.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_rate_limited_waits_for_retry_after(self):
+        ScriptedHandler.responses = [(429, {"retry_after": 0.5})]
+        bucket = TokenBucket(rate=100, capacity=5)
+        response = self.http.request("POST", self.url, bucket, json={})
+        self.assertEqual(response.status_code, 200)
+        first, second = ScriptedHandler.request_times
+        self.assertGreaterEqual(second - first, 0.5)
+
+    @mock.patch.object(transport, "BACKOFF_BASE", 0.2)
+    def test_server_error_backs_off_exponentially(self):
+        ScriptedHandler.responses = [(503, {}), (503, {})]
+        response = self.http.request("POST", self.url, json={})
+        self.assertEqual(response.status_code, 200)
+        first, second, third = ScriptedHandler.request_times
+        self.assertGreaterEqual(second - first, 0.2)
+        self.assertGreaterEqual(third - second, 0.4)
+
+    @mock.patch.object(transport, "BACKOFF_BASE", 0.01)
+    def test_last_response_is_returned_after_all_retries(self):
+        ScriptedHandler.responses = [(503, {})] * 4
+        response = self.http.request("POST", self.url, json={})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(ScriptedHandler.request_times), 4)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced_at_rate(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        start = time.monotonic()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)  # Burst of the capacity
+        for _ in range(3):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.3 - 0.02)
+
+    def test_pause_holds_back_the_next_token(self):
+        bucket = TokenBucket(rate=100, capacity=5)
+        bucket.pause(0.3)
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()